@@ -0,0 +1,401 @@
+# ------------------------------
+# activity_log.py - append-only volunteer activity log
+# ------------------------------
+# Check-ins, logged hours and ratings are appended as fixed-width binary
+# records (EVENT_DTYPE, 25 bytes each) to numbered segment files:
+#
+#     activity_log/segment-000001.bin   16-byte header + records
+#
+# Segments are never rewritten; a full segment is closed and the next one
+# started. Reading is a memory map per segment.
+#
+# RollingWindows keeps, for every volunteer (or NGO), a ring of the last 90
+# daily totals, so 7/30/90-day hours, show-up rate and ratings are a sum
+# over a few ring slots and memory stays fixed per entity however long the
+# log grows. Batches are folded in with vectorized scatter-adds.
+#
+#     python activity_log.py bench --volunteers 100000    # replay a year
+#     python activity_log.py check                         # crash-recovery check
+
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+EVENT_DTYPE = np.dtype([
+    ("ts", "<i8"),            # unix seconds
+    ("volunteer_id", "<i8"),
+    ("ngo_id", "<i4"),
+    ("kind", "u1"),
+    ("value", "<f4"),
+])
+
+# Event kinds and what "value" means for each
+CHECK_IN = 0  # 1 = showed up, 0 = no-show
+HOURS = 1     # hours worked
+RATING = 2    # satisfaction rating 1-5
+KINDS = {"check_in": CHECK_IN, "hours": HOURS, "rating": RATING}
+MAX_HOURS = 24  # per event
+
+# Events may be dated at most this far past the server clock; a far-future
+# timestamp would advance the rolling windows and clear every ring
+MAX_CLOCK_SKEW = 300  # seconds
+
+MAGIC = b"SEVALOG1"
+HEADER = np.dtype([("magic", "S8"), ("version", "<u4"), ("record_size", "<u4")])
+FORMAT_VERSION = 1
+SEGMENT_RECORDS = 1 << 20  # ~25 MB per segment
+
+DAY = 86400
+RING_DAYS = 90
+WINDOWS = (7, 30, 90)
+
+
+class ActivityLogError(Exception):
+    pass
+
+
+def make_events(volunteer_id, kind, value, ngo_id=0, ts=None):
+    """Build an EVENT_DTYPE array; arguments are scalars or equal-length arrays."""
+    n = max(np.size(volunteer_id), np.size(kind), np.size(value), np.size(ngo_id), np.size(ts))
+    events = np.empty(n, dtype=EVENT_DTYPE)
+    events["ts"] = int(time.time()) if ts is None else ts
+    events["volunteer_id"] = volunteer_id
+    events["ngo_id"] = ngo_id
+    events["kind"] = kind
+    events["value"] = value
+    return events
+
+
+def validate_event(kind, value, ts, now=None):
+    """Error message for an out-of-range event, or None if it may be logged."""
+    now = time.time() if now is None else now
+    if ts < 0:
+        return "ts is before 1970"
+    if ts > now + MAX_CLOCK_SKEW:
+        return "ts is in the future"
+    if kind == CHECK_IN and value not in (0, 1):
+        return "check_in value must be 0 or 1"
+    if kind == HOURS and not 0 <= value <= MAX_HOURS:
+        return f"hours value must be between 0 and {MAX_HOURS}"
+    if kind == RATING and not 1 <= value <= 5:
+        return "rating value must be between 1 and 5"
+    return None
+
+
+def day_of(value):
+    """Day number (days since epoch) for a date, ISO date string or unix time."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    if isinstance(value, date):
+        return (value - date(1970, 1, 1)).days
+    return int(value) // DAY
+
+
+# ------------------------------
+# Segment storage
+# ------------------------------
+class ActivityLog:
+    def __init__(self, directory, segment_records=SEGMENT_RECORDS):
+        self.directory = directory
+        self.segment_records = segment_records
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        segments = self.segment_paths()
+        self._current = segments[-1] if segments else None
+        self._current_records = self._records_in(self._current) if self._current else 0
+        if self._current:
+            self._drop_torn_tail()
+
+    def segment_paths(self):
+        names = sorted(n for n in os.listdir(self.directory) if n.startswith("segment-") and n.endswith(".bin"))
+        return [os.path.join(self.directory, n) for n in names]
+
+    def _records_in(self, path):
+        return (os.path.getsize(path) - HEADER.itemsize) // EVENT_DTYPE.itemsize
+
+    def _drop_torn_tail(self):
+        # A crash mid-append can leave a partial record at the end of the last
+        # segment; appending after it would misalign every later record
+        size = HEADER.itemsize + max(self._current_records, 0) * EVENT_DTYPE.itemsize
+        if os.path.getsize(self._current) > size:
+            with open(self._current, "r+b") as f:
+                f.truncate(size)
+
+    def _new_segment(self):
+        number = len(self.segment_paths()) + 1
+        path = os.path.join(self.directory, f"segment-{number:06d}.bin")
+        header = np.array([(MAGIC, FORMAT_VERSION, EVENT_DTYPE.itemsize)], dtype=HEADER)
+        with open(path, "xb") as f:
+            header.tofile(f)
+        self._current, self._current_records = path, 0
+
+    def append(self, events, fsync=False):
+        """Append EVENT_DTYPE records, starting new segments as they fill."""
+        events = np.asarray(events, dtype=EVENT_DTYPE)
+        with self._lock:
+            written = 0
+            while written < len(events):
+                if self._current is None or self._current_records >= self.segment_records:
+                    self._new_segment()
+                take = min(len(events) - written, self.segment_records - self._current_records)
+                with open(self._current, "ab") as f:
+                    events[written:written + take].tofile(f)
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                self._current_records += take
+                written += take
+
+    def read_segment(self, path):
+        header = np.fromfile(path, dtype=HEADER, count=1)
+        if len(header) != 1 or header["magic"][0] != MAGIC or header["version"][0] != FORMAT_VERSION:
+            raise ActivityLogError(f"{path} is not an activity log segment")
+        if header["record_size"][0] != EVENT_DTYPE.itemsize:
+            raise ActivityLogError(f"{path}: unexpected record size {header['record_size'][0]}")
+        # A crash mid-append can leave a partial trailing record; ignore it
+        count = self._records_in(path)
+        if count == 0:
+            return np.empty(0, dtype=EVENT_DTYPE)
+        return np.memmap(path, dtype=EVENT_DTYPE, mode="r", offset=HEADER.itemsize, shape=(count,))
+
+    def segments(self):
+        for path in self.segment_paths():
+            yield self.read_segment(path)
+
+
+# ------------------------------
+# Rolling windows
+# ------------------------------
+class RollingWindows:
+    """Per-entity ring of daily totals over the last RING_DAYS days."""
+
+    def __init__(self, key, count_dtype=np.uint16):
+        self.key = key  # "volunteer_id" or "ngo_id"
+        self.index = pd.Index([], dtype="int64")
+        # Day-major (slot, entity): entering a new day clears one contiguous row
+        self.hours = np.zeros((RING_DAYS, 0), dtype=np.float32)
+        self.check_ins = np.zeros((RING_DAYS, 0), dtype=count_dtype)
+        self.showed_up = np.zeros((RING_DAYS, 0), dtype=count_dtype)
+        self.rating_sum = np.zeros((RING_DAYS, 0), dtype=np.float32)
+        self.ratings = np.zeros((RING_DAYS, 0), dtype=count_dtype)
+        self.current_day = None  # newest day folded in
+
+    def _arrays(self):
+        return ("hours", "check_ins", "showed_up", "rating_sum", "ratings")
+
+    def _rows(self, ids):
+        rows = self.index.get_indexer(ids)
+        missing = rows < 0
+        if missing.any():
+            new_ids = np.unique(ids[missing])
+            self.index = self.index.append(pd.Index(new_ids))
+            for name in self._arrays():
+                grown = np.zeros((RING_DAYS, len(self.index)), dtype=getattr(self, name).dtype)
+                grown[:, :len(self.index) - len(new_ids)] = getattr(self, name)
+                setattr(self, name, grown)
+            rows = self.index.get_indexer(ids)
+        return rows
+
+    def _advance(self, day):
+        # Zero the ring slots of the days being entered
+        if self.current_day is None:
+            self.current_day = day
+            return
+        if day <= self.current_day:
+            return
+        days = np.arange(self.current_day + 1, min(day, self.current_day + RING_DAYS) + 1)
+        for name in self._arrays():
+            getattr(self, name)[days % RING_DAYS] = 0
+        self.current_day = day
+
+    def ingest(self, events):
+        if len(events) == 0:
+            return
+        days = events["ts"] // DAY
+        self._advance(int(days.max()))
+        keep = days > self.current_day - RING_DAYS  # older events fell out of every window
+        if not keep.all():
+            events, days = events[keep], days[keep]
+        rows = self._rows(np.asarray(events[self.key], dtype=np.int64))
+        # Each measure is a bincount over (day slot, entity) cells, added to
+        # the ring in place. Small rings (e.g. NGOs) are counted densely;
+        # otherwise one sort first groups the batch by the cells it touches.
+        flat = days % RING_DAYS * len(self.index) + rows
+        if RING_DAYS * len(self.index) <= 2 * len(flat):
+            cells, cell_of = np.arange(RING_DAYS * len(self.index)), flat
+        else:
+            cells, cell_of = np.unique(flat, return_inverse=True)
+        kind, value = events["kind"], events["value"].astype(np.float64)
+        check_in = kind == CHECK_IN
+        for target, amount in (
+            (self.hours, np.where(kind == HOURS, value, 0)),
+            (self.check_ins, check_in),
+            (self.showed_up, check_in & (value > 0)),
+            (self.rating_sum, np.where(kind == RATING, value, 0)),
+            (self.ratings, kind == RATING),
+        ):
+            sums = np.bincount(cell_of, weights=amount, minlength=len(cells))
+            target.reshape(-1)[cells] += sums.astype(target.dtype)
+
+    def windows(self, entity_id, as_of=None):
+        """Totals over the last 7/30/90 days up to ``as_of`` (a day number,
+        default the newest day in the log), or None for an unknown entity."""
+        row = self.index.get_indexer([entity_id])[0]
+        if row < 0 or self.current_day is None:
+            return None
+        as_of = self.current_day if as_of is None else as_of
+        result = {}
+        for window in WINDOWS:
+            days = np.arange(as_of - window + 1, as_of + 1)
+            days = days[(days <= self.current_day) & (days > self.current_day - RING_DAYS)]
+            slots = days % RING_DAYS
+            check_ins = int(self.check_ins[slots, row].sum())
+            ratings = int(self.ratings[slots, row].sum())
+            result[f"{window}d"] = {
+                "hours": round(float(self.hours[slots, row].sum()), 2),
+                "check_ins": check_ins,
+                "show_up_rate": round(int(self.showed_up[slots, row].sum()) / check_ins, 4) if check_ins else None,
+                "ratings": ratings,
+                "avg_rating": round(float(self.rating_sum[slots, row].sum()) / ratings, 4) if ratings else None,
+            }
+        return result
+
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self._arrays())
+
+
+class ActivityStats:
+    """Rolling windows per volunteer and per NGO, fed from the log."""
+
+    def __init__(self):
+        self.volunteers = RollingWindows("volunteer_id")
+        # An NGO can see far more than 65535 check-ins a day, a volunteer can't
+        self.ngos = RollingWindows("ngo_id", count_dtype=np.uint32)
+        self._lock = threading.Lock()
+
+    def ingest(self, events):
+        with self._lock:
+            self.volunteers.ingest(events)
+            self.ngos.ingest(events)
+
+    def replay(self, log, batch=1 << 20):
+        """Fold every record of ``log`` in, segment by segment."""
+        total = 0
+        horizon = time.time() + MAX_CLOCK_SKEW
+        for segment in log.segments():
+            for start in range(0, len(segment), batch):
+                chunk = np.asarray(segment[start:start + batch])
+                chunk = chunk[chunk["ts"] <= horizon]  # never let a future-dated record clear the rings
+                self.ingest(chunk)
+                total += len(chunk)
+        return total
+
+    def volunteer(self, volunteer_id, as_of=None):
+        with self._lock:
+            return self.volunteers.windows(volunteer_id, as_of)
+
+    def ngo(self, ngo_id, as_of=None):
+        with self._lock:
+            return self.ngos.windows(ngo_id, as_of)
+
+    def as_of_date(self, as_of=None):
+        day = self.volunteers.current_day if as_of is None else as_of
+        return None if day is None else datetime.fromtimestamp(day * DAY, tz=timezone.utc).date().isoformat()
+
+
+# ------------------------------
+# Self-check
+# ------------------------------
+def check():
+    """Recovery from a torn append: a partial trailing record is dropped on
+    open so the next append stays aligned."""
+    directory = tempfile.mkdtemp(prefix="activity_check_")
+    try:
+        log = ActivityLog(directory)
+        log.append(make_events([101, 102], HOURS, [2.5, 3.0], ngo_id=7, ts=1_700_000_000))
+        with open(log.segment_paths()[-1], "ab") as f:
+            f.write(b"\x01\x02\x03")  # crash mid-record
+        torn = ActivityLog(directory)
+        torn.append(make_events(103, RATING, 4, ngo_id=7, ts=1_700_000_100))
+        records = np.concatenate([np.asarray(s) for s in torn.segments()])
+        assert records["volunteer_id"].tolist() == [101, 102, 103], records
+        assert records["value"].tolist() == [2.5, 3.0, 4.0], records
+        size = os.path.getsize(torn.segment_paths()[-1])
+        assert size == HEADER.itemsize + 3 * EVENT_DTYPE.itemsize, size
+        print("torn tail: truncated on open, later appends aligned")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# ------------------------------
+# Benchmark
+# ------------------------------
+def synthetic_year(volunteers, ngos, events_per_week, start=date(2025, 1, 1), seed=0):
+    """Yield one day of events at a time: check-in, hours and rating per visit."""
+    rng = np.random.default_rng(seed)
+    ngo_of = rng.integers(1, ngos + 1, volunteers)
+    visits_per_day = int(volunteers * events_per_week / 7)
+    first = day_of(start)
+    for day in range(first, first + 365):
+        who = rng.integers(0, volunteers, visits_per_day)
+        ts = day * DAY + rng.integers(0, DAY, visits_per_day)
+        showed = (rng.random(visits_per_day) < 0.85).astype(np.float32)
+        hours = np.round(rng.uniform(1, 8, visits_per_day), 1) * showed
+        rating = rng.integers(1, 6, visits_per_day)
+        ids, ngo = who + 101, ngo_of[who]
+        events = np.concatenate([
+            make_events(ids, CHECK_IN, showed, ngo, ts),
+            make_events(ids[showed > 0], HOURS, hours[showed > 0], ngo[showed > 0], ts[showed > 0] + 1),
+            make_events(ids[showed > 0], RATING, rating[showed > 0], ngo[showed > 0], ts[showed > 0] + 2),
+        ])
+        yield events[np.argsort(events["ts"], kind="stable")]
+
+
+def benchmark(volunteers, ngos=500, events_per_week=1.0, keep=None):
+    directory = keep or tempfile.mkdtemp(prefix="activity_bench_")
+    try:
+        log = ActivityLog(directory)
+        start = time.perf_counter()
+        for events in synthetic_year(volunteers, ngos, events_per_week):
+            log.append(events)
+        write = time.perf_counter() - start
+        records = sum(len(s) for s in log.segments())
+        size_mb = sum(os.path.getsize(p) for p in log.segment_paths()) / 1e6
+        print(f"{volunteers} volunteers, {ngos} NGOs, {events_per_week:g} visits/volunteer/week over 365 days")
+        print(f"{'append':24s} {records:>11,} records  {size_mb:7.0f} MB  {write:6.2f}s")
+
+        stats = ActivityStats()
+        start = time.perf_counter()
+        stats.replay(log)
+        replay = time.perf_counter() - start
+        print(f"{'replay + aggregate':24s} {records / replay:>11,.0f} records/s        {replay:6.2f}s")
+        print(f"{'window state':24s} {(stats.volunteers.nbytes() + stats.ngos.nbytes()) / 1e6:>11.1f} MB (fixed per entity)")
+
+        start = time.perf_counter()
+        for vid in range(101, 101 + 1000):
+            stats.volunteer(vid)
+        print(f"{'query (per volunteer)':24s} {(time.perf_counter() - start) / 1000 * 1e6:>11.1f} us")
+    finally:
+        if not keep:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Volunteer activity log")
+    parser.add_argument("command", choices=["bench", "check"])
+    parser.add_argument("--volunteers", type=int, default=100_000)
+    parser.add_argument("--ngos", type=int, default=500)
+    parser.add_argument("--events-per-week", type=float, default=1.0)
+    parser.add_argument("--keep", help="write the log to this directory and keep it")
+    args = parser.parse_args()
+    if args.command == "check":
+        check()
+    else:
+        benchmark(args.volunteers, args.ngos, args.events_per_week, args.keep)
@@ -0,0 +1,208 @@
+# ------------------------------
+# admission.py - rate limiting, concurrency limits and load shedding
+# ------------------------------
+# Every API request passes through AdmissionController.admit() before its
+# view runs:
+#
+#   1. Per-client token bucket (client = remote address; the X-Client-ID
+#      header is honoured only from a trusted proxy, since any caller could
+#      otherwise rotate it for a fresh bucket). An empty bucket answers 429
+#      with Retry-After.
+#   2. A global cap on in-flight requests plus per-endpoint caps, so a burst
+#      of team formations can't occupy every worker thread.
+#   3. Requests over a cap wait in a bounded priority queue. Interactive
+#      lookups are admitted before bulk work (X-Priority: bulk, or a bulk
+#      endpoint such as /api/schedule_events).
+#   4. Load shedding: when the oldest queued request has waited longer than
+#      the threshold (half of it for bulk work), new requests are refused
+#      with 503 + Retry-After instead of joining the queue, and a queued
+#      request that reaches the threshold gives up the same way.
+#
+# stats() reports queue depth, in-flight counts and rejection counters for
+# /api/admin/load.
+
+import heapq
+import itertools
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+INTERACTIVE, BULK = 0, 1
+PRIORITY_NAMES = {"interactive": INTERACTIVE, "bulk": BULK}
+
+# Defaults, overridable through the environment
+RATE = float(os.environ.get("SEVASETU_RATE", "20"))                 # requests/s per client
+BURST = float(os.environ.get("SEVASETU_BURST", "40"))               # bucket size
+MAX_CONCURRENT = int(os.environ.get("SEVASETU_MAX_CONCURRENT", "16"))
+MAX_QUEUE = int(os.environ.get("SEVASETU_MAX_QUEUE", "64"))
+MAX_QUEUE_WAIT = float(os.environ.get("SEVASETU_MAX_QUEUE_WAIT", "2.0"))  # seconds
+
+MAX_CLIENTS = 10_000  # token buckets kept (least recently seen dropped)
+
+# Addresses of reverse proxies allowed to name the client via X-Client-ID
+TRUSTED_PROXIES = frozenset(a.strip() for a in os.environ.get("SEVASETU_TRUSTED_PROXIES", "").split(",") if a.strip())
+
+
+class Rejected(Exception):
+    def __init__(self, status, reason, retry_after):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+def client_key(remote_addr, client_id=None, trusted_proxies=TRUSTED_PROXIES):
+    """Rate-limit key: the caller's address, or the X-Client-ID it forwards
+    when the caller is a trusted proxy."""
+    if client_id and remote_addr in trusted_proxies:
+        return client_id
+    return remote_addr
+
+
+class TokenBuckets:
+    """One lazily refilled token bucket per client."""
+
+    def __init__(self, rate=RATE, burst=BURST, max_clients=MAX_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()  # client -> [tokens, last_refill]
+        self._lock = threading.Lock()
+
+    def take(self, client, now=None):
+        """Spend one token; returns 0 on success, else seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = self._buckets[client] = [self.burst, now]
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0
+            return (1 - bucket[0]) / self.rate
+
+
+class AdmissionController:
+    def __init__(self, endpoint_limits=None, bulk_endpoints=(), max_concurrent=MAX_CONCURRENT,
+                 max_queue=MAX_QUEUE, max_queue_wait=MAX_QUEUE_WAIT, rate=RATE, burst=BURST):
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self.bulk_endpoints = set(bulk_endpoints)
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.buckets = TokenBuckets(rate, burst)
+
+        self._cond = threading.Condition()
+        self._queue = []  # heap of (priority, seq, endpoint, enqueued_at)
+        self._seq = itertools.count()
+        self.in_flight = 0
+        self.in_flight_by_endpoint = {}
+        self.counters = {"admitted": 0, "queued": 0, "rate_limited": 0, "queue_full": 0,
+                         "shed": 0, "timed_out": 0}
+        self.max_wait_seen = 0.0
+
+    def priority_of(self, endpoint, requested=None):
+        if requested in PRIORITY_NAMES:
+            # Clients may lower their own priority, but not raise a bulk endpoint
+            return max(PRIORITY_NAMES[requested], BULK if endpoint in self.bulk_endpoints else INTERACTIVE)
+        return BULK if endpoint in self.bulk_endpoints else INTERACTIVE
+
+    # ------------------------------
+    # Admission
+    # ------------------------------
+    def _has_room(self, endpoint):
+        limit = self.endpoint_limits.get(endpoint)
+        return (self.in_flight < self.max_concurrent
+                and (limit is None or self.in_flight_by_endpoint.get(endpoint, 0) < limit))
+
+    def _start(self, endpoint):
+        self.in_flight += 1
+        self.in_flight_by_endpoint[endpoint] = self.in_flight_by_endpoint.get(endpoint, 0) + 1
+        self.counters["admitted"] += 1
+
+    def _queue_latency(self, now):
+        return now - min(entry[3] for entry in self._queue) if self._queue else 0.0
+
+    def _first_eligible(self):
+        # Highest priority, then oldest, among waiters whose endpoint has room
+        for entry in sorted(self._queue):
+            if self._has_room(entry[2]):
+                return entry
+        return None
+
+    def admit(self, client, endpoint, priority=INTERACTIVE):
+        """Block until ``endpoint`` may run for ``client`` or raise Rejected.
+        Every successful admit() must be paired with release(endpoint)."""
+        wait = self.buckets.take(client)
+        if wait:
+            with self._cond:
+                self.counters["rate_limited"] += 1
+            raise Rejected(429, "rate limit exceeded", wait)
+
+        with self._cond:
+            now = time.monotonic()
+            entry = (priority, next(self._seq), endpoint, now)
+            heapq.heappush(self._queue, entry)
+            queued = False
+            try:
+                if self._first_eligible() is not entry:
+                    # Would have to wait: shed instead if the queue is already slow or full
+                    threshold = self.max_queue_wait if priority == INTERACTIVE else self.max_queue_wait / 2
+                    if self._queue_latency(now) > threshold:
+                        self.counters["shed"] += 1
+                        raise Rejected(503, "server overloaded", self.max_queue_wait)
+                    if len(self._queue) > self.max_queue:
+                        self.counters["queue_full"] += 1
+                        raise Rejected(503, "request queue full", self.max_queue_wait)
+
+                    queued = True
+                    self.counters["queued"] += 1
+                    deadline = now + self.max_queue_wait
+                    while self._first_eligible() is not entry:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.counters["timed_out"] += 1
+                            raise Rejected(503, "timed out waiting in queue", self.max_queue_wait)
+                        self._cond.wait(remaining)
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                if queued:
+                    self.max_wait_seen = max(self.max_wait_seen, time.monotonic() - now)
+                    # The next waiter may be eligible now that this entry is gone
+                    self._cond.notify_all()
+            self._start(endpoint)
+
+    def release(self, endpoint):
+        with self._cond:
+            self.in_flight -= 1
+            self.in_flight_by_endpoint[endpoint] -= 1
+            self._cond.notify_all()
+
+    # ------------------------------
+    # Stats
+    # ------------------------------
+    def stats(self):
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "in_flight": self.in_flight,
+                "in_flight_by_endpoint": {e: n for e, n in self.in_flight_by_endpoint.items() if n},
+                "queue_depth": len(self._queue),
+                "queue_depth_by_priority": {name: sum(1 for e in self._queue if e[0] == p)
+                                            for name, p in PRIORITY_NAMES.items()},
+                "queue_latency_ms": round(self._queue_latency(now) * 1000, 1),
+                "max_queue_wait_seen_ms": round(self.max_wait_seen * 1000, 1),
+                "counters": dict(self.counters),
+                "limits": {"rate_per_client": self.buckets.rate, "burst": self.buckets.burst,
+                           "max_concurrent": self.max_concurrent, "max_queue": self.max_queue,
+                           "max_queue_wait_s": self.max_queue_wait, "endpoints": self.endpoint_limits},
+            }
@@ -0,0 +1,102 @@
+# ------------------------------
+# api_client.py - caching HTTP client for the Tkinter GUI
+# ------------------------------
+# Responses are cached per (method, path, parameters). Fresh entries (younger
+# than the TTL) are served without touching the network; stale ones are
+# revalidated with If-None-Match so an unchanged result costs a bodyless 304.
+# Identical requests already in flight are coalesced onto the same future,
+# and prefetch() warms the cache from a background thread.
+
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+
+DEFAULT_TTL = 60  # seconds
+MAX_RETRY_AFTER = 3  # seconds; longer throttling is reported instead of waited out
+
+
+class ApiClient:
+    def __init__(self, base_url, ttl=DEFAULT_TTL, timeout=10, prefetch_workers=2):
+        self.base_url = base_url.rstrip("/")
+        self.ttl = ttl
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._cache = {}      # key -> (data, etag, fetched_at)
+        self._inflight = {}   # key -> Future
+        self._lock = threading.Lock()
+        self._prefetcher = ThreadPoolExecutor(max_workers=prefetch_workers, thread_name_prefix="prefetch")
+
+    def _key(self, method, path, payload):
+        return method, path, json.dumps(payload, sort_keys=True, default=str)
+
+    def request(self, method, path, json=None, params=None, use_cache=True):
+        """Return the decoded JSON body for ``method path``."""
+        payload = {"json": json, "params": params}
+        key = self._key(method, path, payload)
+
+        with self._lock:
+            cached = self._cache.get(key) if use_cache else None
+            if cached and time.monotonic() - cached[2] < self.ttl:
+                return cached[0]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            data = self._fetch(method, path, json, params, key, cached)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _fetch(self, method, path, json, params, key, cached):
+        headers = {"If-None-Match": cached[1]} if cached and cached[1] else {}
+        response = self.session.request(method, f"{self.base_url}{path}", json=json, params=params,
+                                        headers=headers, timeout=self.timeout)
+        if response.status_code in (429, 503):
+            # Rate limited or shed by the server: retry once after a short Retry-After
+            retry_after = int(response.headers.get("Retry-After", "0") or 0)
+            if 0 < retry_after <= MAX_RETRY_AFTER:
+                time.sleep(retry_after)
+                response = self.session.request(method, f"{self.base_url}{path}", json=json, params=params,
+                                                headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            data = cached[0]
+        else:
+            data = response.json()
+        etag = response.headers.get("ETag")
+        with self._lock:
+            if response.ok or response.status_code == 304:
+                self._cache[key] = (data, etag or (cached[1] if cached else None), time.monotonic())
+        return data
+
+    def get(self, path, params=None, **kwargs):
+        return self.request("GET", path, params=params, **kwargs)
+
+    def post(self, path, json=None, **kwargs):
+        return self.request("POST", path, json=json, **kwargs)
+
+    def prefetch(self, method, path, json=None, params=None):
+        """Warm the cache in the background; errors are ignored."""
+        def run():
+            try:
+                self.request(method, path, json=json, params=params)
+            except Exception:
+                pass
+        self._prefetcher.submit(run)
+
+    def invalidate(self, path_prefix=""):
+        with self._lock:
+            for key in [k for k in self._cache if k[1].startswith(path_prefix)]:
+                del self._cache[key]
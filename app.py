@@ -2,113 +2,596 @@
 # app.py (updated version)
 # ------------------------------
 
-from flask import Flask, request, jsonify
+from collections import Counter
+
+from flask import Flask, Response, g, redirect, request, jsonify, url_for
+import numpy as np
 import pandas as pd
+import hashlib
 import joblib
+import os
+import time
 import warnings
+from datetime import datetime, timezone
+
+from activity_log import KINDS, ActivityLog, ActivityStats, day_of, make_events, validate_event
+from admission import AdmissionController, Rejected, client_key
+from artifacts import ARTIFACTS_DIR, load_artifacts
+from charts import FORMATS as CHART_FORMATS, ChartCache, bar_chart, pie_chart
+from cleaning import INTEGER_COLUMNS, NUMERIC_COLUMNS, matching_categories, numeric_value, training_value
+from cubes import DIMENSIONS, DashboardCubes
+from geo import DistrictIndex, ngo_district
+from ingest import ingest_csv
+from languages import LanguageIndex
+from ranking import SCORE_COLUMNS, VolunteerRanking
+from sampling import request_seed, sample_team, strata_codes
+from scheduling import Scheduler, event_error
 
 app = Flask(__name__)
 
-# Load dataset
-df = pd.read_csv("NGO_Volunteers_Maharashtra_1000.csv")
+# Load dataset (validated and normalized; bad rows are quarantined)
+df, data_quality_report = ingest_csv("NGO_Volunteers_Maharashtra_1000.csv",
+                                     quarantine_path="quarantined_volunteers.csv")
+if data_quality_report["rows_quarantined"]:
+    warnings.warn(f"{data_quality_report['rows_quarantined']} volunteer rows quarantined: "
+                  f"{data_quality_report['reasons']}")
+
+# Load ML models: exported artifacts (see artifacts.py) when present,
+# otherwise the original joblib pickles
+team_formation_model = None
+skilled_volunteer_filter_function = None
+skill_gap_suggestions = None
+
+if os.path.exists(os.path.join(ARTIFACTS_DIR, "manifest.json")):
+    model_artifacts = load_artifacts(ARTIFACTS_DIR)
+    skill_gap_suggestions = model_artifacts.get("skill_gap_training_suggestions")
+    # team_formation_model / skilled_volunteer_filter_function were pickled
+    # notebook functions with no learned state; the fallbacks below replace them
+else:
+    try:
+        team_formation_model = joblib.load("models/team_formation_model.pkl")
+    except:
+        warnings.warn("team_formation_model.pkl cannot be loaded. Using fallback function.")
+        team_formation_model = None
+
+    try:
+        skilled_volunteer_filter_function = joblib.load("models/skilled_volunteer_filter_function.pkl")
+    except:
+        warnings.warn("skilled_volunteer_filter_function.pkl cannot be loaded. Using fallback function.")
+        skilled_volunteer_filter_function = None
+
+# Precomputed quality ranking per (skill, district)
+volunteer_ranking = VolunteerRanking(df)
+
+# Spatial index for nearest-volunteer search by district
+district_index = DistrictIndex(df)
+
+# Availability bitsets for event roster scheduling
+scheduler = Scheduler(df)
+
+# Pre-aggregated dashboard cubes (District x Skill x Category x Gender x Availability)
+dashboard_cubes = DashboardCubes(df)
+
+# District x skill strata for seeded, stratified team sampling
+team_strata = strata_codes(df['District'], df['Primary_Skill'])
+
+# Languages_Known parsed once into per-volunteer bitmasks
+language_index = LanguageIndex(df['Languages_Known'])
+
+# Append-only activity log (check-ins, hours, ratings) with rolling
+# 7/30/90-day windows per volunteer and per NGO, rebuilt from the log on start
+ACTIVITY_DIR = "activity_log"
+volunteer_activity = ActivityLog(ACTIVITY_DIR)
+activity_stats = ActivityStats()
+activity_stats.replay(volunteer_activity)
 
-# Load ML models
-try:
-    team_formation_model = joblib.load("models/team_formation_model.pkl")
-except:
-    warnings.warn("team_formation_model.pkl cannot be loaded. Using fallback function.")
-    team_formation_model = None
+# Rendered chart images, keyed by chart, parameters and data version
+chart_cache = ChartCache()
+# Identifies this process's dataset: a hash of the loaded rows plus a
+# per-start nonce, so a versioned chart URL never names different data
+# after a restart, even though dashboard_cubes.version restarts at 0
+DATA_FINGERPRINT = hashlib.sha256(
+    pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes() + os.urandom(8)
+).hexdigest()[:16]
 
-try:
-    skilled_volunteer_filter_function = joblib.load("models/skilled_volunteer_filter_function.pkl")
-except:
-    warnings.warn("skilled_volunteer_filter_function.pkl cannot be loaded. Using fallback function.")
-    skilled_volunteer_filter_function = None
+# Rate limits, concurrency caps and priority queueing for API requests
+admission = AdmissionController(
+    endpoint_limits={"api_form_team": 4, "api_skilled_volunteers": 8,
+                     "api_schedule_events": 2, "api_chart": 4},
+    bulk_endpoints={"api_schedule_events"},
+)
 
 # ------------------------------
 # Helper: fallback selection
 # ------------------------------
-def fallback_selection(skill=None, district=None, top_n=5):
-    subset = df.copy()
-    if skill:
-        subset = subset[subset['Primary_Skill'].str.contains(skill, case=False, na=False)]
-    if district:
-        subset = subset[subset['District'].str.contains(district, case=False, na=False)]
-    # Fallback by Language or Address if subset is too small
-    if len(subset) < top_n:
-        fallback_subset = df.copy()
+def fallback_selection(skill=None, district=None, top_n=5, languages=None, languages_mode="all"):
+    mask = language_mask(languages, languages_mode)
+    # Best-ranked matches first
+    rows = list(volunteer_ranking.top(top_n, skill=skill, district=district, mask=mask))
+
+    def fill(more):
+        # Append rows not already picked, up to top_n
+        picked = set(rows)
+        rows.extend(r for r in more if r not in picked)
+        del rows[top_n:]
+
+    # Too few in the district: same skill in the nearest districts
+    if district and len(rows) < top_n:
+        near, _ = district_index.nearest_volunteers(district, top_n, skill=skill,
+                                                    order_key=volunteer_ranking.scores, mask=mask)
+        fill(int(r) for r in near)
+    # Still short: Secondary_Skill matches (everyone without a skill), best-ranked first
+    pool = df if mask is None else df[mask]
+    if len(rows) < top_n:
+        wider = pool
         if skill:
-            fallback_subset = fallback_subset[fallback_subset['Languages_Known'].str.contains(skill, case=False, na=False)]
-        if len(fallback_subset) >= top_n:
-            subset = fallback_subset
-        else:
-            subset = df.sample(min(top_n, len(df)))  # Random fallback
-    return subset.head(top_n)[['Volunteer_Name', 'Primary_Skill', 'District']].to_dict(orient='records')
+            wider = pool[pool['Secondary_Skill'].isin(matching_categories(df['Secondary_Skill'], skill))]
+        wider = wider.index.to_numpy()
+        fill(int(r) for r in wider[(-volunteer_ranking.scores[wider]).argsort(kind="stable")])
+    if len(rows) < top_n:
+        # Seeded random fill, so the same query keeps the same answer
+        seed = request_seed({"skill": skill, "district": district, "top_n": top_n,
+                             "languages": languages, "languages_mode": languages_mode})
+        rest = np.setdiff1d(pool.index.to_numpy(), rows)
+        fill(int(r) for r in sample_team(rest, team_strata, volunteer_ranking.scores, top_n - len(rows), seed))
+    return df.iloc[rows][['Volunteer_Name', 'Primary_Skill', 'District']].to_dict(orient='records')
 
 # ------------------------------
-# API Endpoints
+# Helper: seeded stratified team
 # ------------------------------
+def stratified_team(skill=None, top_n=5, seed=0, languages=None, languages_mode="all"):
+    # Candidates: primary-skill matches, widened to secondary skill, then to
+    # everyone, until there are enough. Members are then drawn across
+    # district x skill strata, favouring higher-ranked volunteers.
+    mask = language_mask(languages, languages_mode)
+    candidates = np.ones(len(df), dtype=bool) if mask is None else mask
+    if skill:
+        primary = df['Primary_Skill'].isin(matching_categories(df['Primary_Skill'], skill)).to_numpy()
+        secondary = df['Secondary_Skill'].isin(matching_categories(df['Secondary_Skill'], skill)).to_numpy()
+        for pool in (primary, primary | secondary):
+            if np.count_nonzero(candidates & pool) >= top_n:
+                candidates = candidates & pool
+                break
+    rows = sample_team(np.flatnonzero(candidates), team_strata, volunteer_ranking.scores, top_n, seed)
+    return df.iloc[rows][['Volunteer_Name', 'Primary_Skill', 'District']].to_dict(orient='records')
 
-@app.route("/api/form_team", methods=["POST"])
-def api_form_team():
-    data = request.get_json()
+def language_mask(languages, mode="all"):
+    # Boolean row filter for a languages query, or None when not filtering
+    if not languages:
+        return None
+    return language_index.match(languages, mode="any" if mode == "any" else "all")
+
+# ------------------------------
+# Helper: nearest volunteers by district
+# ------------------------------
+def nearby_selection(skill=None, district=None, top_n=5, radius_km=None, mask=None):
+    rows, dist = district_index.nearest_volunteers(district, top_n, skill=skill, radius_km=radius_km,
+                                                   order_key=volunteer_ranking.scores, mask=mask)
+    result = df.iloc[rows][['Volunteer_Name', 'Primary_Skill', 'District']].copy()
+    result['Distance_km'] = dist.round(1)
+    return result.to_dict(orient='records')
+
+def search_center(data):
+    # District to search around: explicit district, else the NGO's address
+    if data.get("district"):
+        return data["district"]
+    if data.get("ngo_id") is not None:
+        return ngo_district(df, data["ngo_id"])
+    return None
+
+def search_radius(data):
+    # radius_km as a non-negative number of kilometres; ValueError otherwise
+    try:
+        radius = float(data["radius_km"])
+    except (TypeError, ValueError):
+        raise ValueError(data["radius_km"])
+    if not np.isfinite(radius) or radius < 0:
+        raise ValueError(radius)
+    return radius
+
+# ------------------------------
+# Request handlers
+# ------------------------------
+# Plain functions returning JSON-ready payloads. The Flask views below and the
+# asyncio variant in async_app.py both dispatch to these, so the two servers
+# always answer with the same shapes.
+
+# "sample": seeded, stratified, score-weighted draw (default);
+# "top": the best-ranked volunteers from the precomputed ranking
+TEAM_STRATEGIES = ("sample", "top")
+
+def form_team_payload(data):
     skill = data.get("skill")
     team_size = data.get("team_size", 5)
-    if team_formation_model:
+    languages = data.get("languages")
+    languages_mode = data.get("languages_mode", "all")
+    center = search_center(data)
+    if data.get("date"):
+        # Staff a specific event: only volunteers available on that day/slot
+        event = {"date": data["date"], "slot": data.get("slot", "day"), "skill": skill,
+                 "district": data.get("district"), "headcount": team_size}
+        problem = event_error(event)
+        if problem:
+            return {"error": problem.replace("headcount", "team_size")}
+        roster = scheduler.schedule([event], order_key=volunteer_ranking.scores,
+                                    mask=language_mask(languages, languages_mode))[0]["assigned"]
+        return [{k: v[k] for k in ('Volunteer_Name', 'Primary_Skill', 'District')} for v in roster]
+    if center and data.get("radius_km") is not None:
+        try:
+            radius_km = search_radius(data)
+        except ValueError:
+            return {"error": "radius_km must be a non-negative number"}
+        return nearby_selection(skill=skill, district=center, top_n=team_size,
+                                radius_km=radius_km,
+                                mask=language_mask(languages, languages_mode))
+    if team_formation_model and not languages:
         team = team_formation_model(skill, team_size=team_size)
         if isinstance(team, pd.DataFrame):
-            return jsonify(team[['Volunteer_Name', 'Primary_Skill', 'District']].to_dict(orient='records'))
-    # Fallback
-    return jsonify(fallback_selection(skill=skill, top_n=team_size))
+            return team[['Volunteer_Name', 'Primary_Skill', 'District']].to_dict(orient='records')
+    strategy = data.get("strategy", "sample")
+    if strategy not in TEAM_STRATEGIES:
+        return {"error": f"strategy must be one of {', '.join(TEAM_STRATEGIES)}"}
+    if strategy == "top":
+        # The best-ranked volunteers, deterministic and O(K) per request
+        return fallback_selection(skill=skill, top_n=team_size,
+                                  languages=languages, languages_mode=languages_mode)
+    # Seeded stratified draw: the seed defaults to a hash of the request, so
+    # identical requests form identical teams; pass "seed" to replay or vary
+    try:
+        seed = int(data["seed"]) if data.get("seed") is not None else request_seed(data)
+        if seed < 0:
+            raise ValueError(seed)
+    except (TypeError, ValueError):
+        return {"error": "seed must be a non-negative integer"}
+    return stratified_team(skill=skill, top_n=team_size, seed=seed,
+                           languages=languages, languages_mode=languages_mode)
 
-@app.route("/api/skilled_volunteers", methods=["POST"])
-def api_skilled_volunteers():
-    data = request.get_json()
+def skilled_volunteers_payload(data):
+    top_n = data.get("top_n", 10)
+    if isinstance(top_n, bool) or not isinstance(top_n, int) or top_n < 1:
+        return {"error": "top_n must be a positive integer"}
     skill = data.get("skill")
     district = data.get("district")
-    if skilled_volunteer_filter_function:
+    languages = data.get("languages")
+    languages_mode = data.get("languages_mode", "all")
+    center = search_center(data)
+    if center and data.get("radius_km") is not None:
+        try:
+            radius_km = search_radius(data)
+        except ValueError:
+            return {"error": "radius_km must be a non-negative number"}
+        return nearby_selection(skill=skill, district=center, top_n=top_n,
+                                radius_km=radius_km,
+                                mask=language_mask(languages, languages_mode))
+    if skilled_volunteer_filter_function and not languages:
         df_res = skilled_volunteer_filter_function(skill, district=district)
         if isinstance(df_res, pd.DataFrame) and not df_res.empty:
-            return jsonify(df_res[['Volunteer_Name', 'Primary_Skill', 'District']].to_dict(orient='records'))
+            return df_res[['Volunteer_Name', 'Primary_Skill', 'District']].to_dict(orient='records')
     # Fallback
-    return jsonify(fallback_selection(skill=skill, district=district, top_n=10))
+    return fallback_selection(skill=skill, district=district, top_n=top_n,
+                              languages=languages, languages_mode=languages_mode)
 
-@app.route("/api/showup_prediction", methods=["POST"])
-def api_showup_prediction():
-    data = request.get_json()
+def showup_prediction_payload(data):
     features = data.get("volunteer_features")
     if features is None or len(features) != 3:
-        return jsonify({"error": "Invalid input for showup prediction"})
+        return {"error": "Invalid input for showup prediction"}
     # Placeholder prediction
-    return jsonify({"prediction": "Likely to Show-up"})
+    return {"prediction": "Likely to Show-up"}
+
+def recommend_volunteers_payload(data):
+    # Best-ranked volunteers overall
+    top_n = data.get("top_n", 5)
+    return fallback_selection(top_n=top_n)
+
+def skill_gap_payload():
+    if skill_gap_suggestions:
+        return dict(skill_gap_suggestions)
+    return {
+        "Counseling": "Recommended Counseling Workshop / Online Course",
+        "IT Support": "Recommended IT Support Workshop / Online Course",
+        "Logistics": "Recommended Logistics Workshop / Online Course"
+    }
+
+def feedback_recommendations_payload(data):
+    return {"recommendations": ["Workshop A", "Workshop B"]}
+
+def volunteer_engagement_payload(volunteer_id):
+    # Placeholder data
+    return {"hours_logged": 12, "events_participated": 3}
+
+def schedule_events_payload(data):
+    events = data.get("events")
+    if not events or not isinstance(events, list) or any(not isinstance(e, dict) or "date" not in e for e in events):
+        return {"error": "Provide a list of events, each with a date"}
+    for i, event in enumerate(events):
+        problem = event_error(event)
+        if problem:
+            return {"error": f"Event {i}: {problem}"}
+    cap = data.get("max_events_per_volunteer")
+    if cap is not None and (isinstance(cap, bool) or not isinstance(cap, int) or cap < 1):
+        return {"error": "max_events_per_volunteer must be a positive integer"}
+    rosters = scheduler.schedule(events, max_events_per_volunteer=cap, order_key=volunteer_ranking.scores)
+    return {"rosters": rosters, "unfilled_events": sum(1 for r in rosters if r["shortfall"] > 0)}
+
+def update_volunteer_stats_payload(volunteer_id, data):
+    stats = {k: v for k, v in data.items() if k in SCORE_COLUMNS}
+    if volunteer_id not in volunteer_ranking.row_of or not stats:
+        return {"error": "Unknown volunteer or no rankable stats given"}
+    for column in stats:
+        if column in NUMERIC_COLUMNS:
+            stats[column] = numeric_value(column, stats[column])
+            if stats[column] is None:
+                low, high = NUMERIC_COLUMNS[column]
+                kind = "a whole number" if column in INTEGER_COLUMNS else "a number"
+                return {"error": f"{column} must be {kind} between {low} and {high}"}
+    if "Training_Completed" in stats:
+        stats["Training_Completed"] = training_value(stats["Training_Completed"])
+        if stats["Training_Completed"] is None:
+            return {"error": "Training_Completed must be Yes or No"}
+    row = volunteer_ranking.row_of[volunteer_id]
+    before = df.iloc[row].to_dict()
+    score = volunteer_ranking.update(volunteer_id, stats)
+    dashboard_cubes.replace(before, df.iloc[row].to_dict())
+    return {"volunteer_id": volunteer_id, "score": round(score, 4)}
+
+def dashboard_summary_payload(args):
+    # ?group_by=District,Primary_Skill&Gender=Female
+    group_by = [d.strip() for d in args.get("group_by", "").split(",") if d.strip()]
+    filters = {d: args[d] for d in DIMENSIONS if args.get(d)}
+    try:
+        rows = dashboard_cubes.query(group_by, filters)
+    except KeyError as e:
+        return {"error": str(e.args[0])}
+    return {"group_by": group_by, "filters": filters, "rows": rows, "version": dashboard_cubes.version}
+
+def data_quality_payload():
+    return data_quality_report
+
+def training_suggestions_payload(volunteer_id):
+    # Placeholder data
+    return {"suggestions": ["First Aid Training", "Leadership Workshop"]}
+
+def _timestamp(value):
+    # Unix seconds or ISO datetime (UTC when no offset); default now
+    if value is None:
+        return int(time.time())
+    if isinstance(value, str):
+        parsed = datetime.fromisoformat(value)
+        return int((parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)).timestamp())
+    return int(value)
+
+def record_activity_payload(data):
+    # {"events": [{"volunteer_id": 12, "kind": "hours", "value": 3.5, "ts": "2025-03-01T10:00"}]}
+    events = data.get("events")
+    if not events:
+        return {"error": "Provide a list of events"}
+    ngo_ids = df['NGO_ID'].to_numpy()
+    known_ngos = set(df['NGO_ID'].dropna().tolist())
+    columns = {"volunteer_id": [], "ngo_id": [], "kind": [], "value": [], "ts": []}
+    try:
+        for e in events:
+            volunteer_id = int(e["volunteer_id"])
+            if volunteer_id not in volunteer_ranking.row_of:
+                return {"error": f"Unknown volunteer {volunteer_id}"}
+            if e.get("kind") not in KINDS:
+                return {"error": f"kind must be one of {', '.join(KINDS)}"}
+            kind, value, ts = KINDS[e["kind"]], float(e.get("value", 1)), _timestamp(e.get("ts"))
+            problem = validate_event(kind, value, ts)
+            if problem:
+                return {"error": f"Bad event: {problem}"}
+            ngo_id = int(e.get("ngo_id", ngo_ids[volunteer_ranking.row_of[volunteer_id]]))
+            if ngo_id not in known_ngos:
+                return {"error": f"Unknown NGO {ngo_id}"}
+            columns["volunteer_id"].append(volunteer_id)
+            columns["ngo_id"].append(ngo_id)
+            columns["kind"].append(kind)
+            columns["value"].append(value)
+            columns["ts"].append(ts)
+    except (KeyError, TypeError, ValueError, OverflowError) as err:
+        return {"error": f"Bad event: {err}"}
+    records = make_events(**{k: np.asarray(v) for k, v in columns.items()})
+    volunteer_activity.append(records)
+    activity_stats.ingest(records)
+    return {"recorded": len(records)}
+
+def activity_windows_payload(entity, entity_id, args):
+    # ?as_of=2025-03-31 (default: newest day in the log)
+    try:
+        as_of = day_of(args["as_of"]) if args.get("as_of") else None
+    except ValueError:
+        return {"error": "as_of must be an ISO date"}
+    lookup = activity_stats.volunteer if entity == "volunteer" else activity_stats.ngo
+    windows = lookup(entity_id, as_of)
+    if windows is None:
+        return {"error": f"No activity recorded for {entity} {entity_id}"}
+    return {f"{entity}_id": entity_id, "as_of": activity_stats.as_of_date(as_of), "windows": windows}
+
+# ------------------------------
+# Charts
+# ------------------------------
+# Each chart builds a figure from query-string parameters using the same
+# handlers as the JSON endpoints. data_version() changes whenever volunteer
+# stats are updated or the app restarts, which invalidates every cached image.
+
+def data_version():
+    return f"{DATA_FINGERPRINT}-{dashboard_cubes.version}"
+
+def skill_distribution_chart(args):
+    # ?District=Pune&Gender=Female
+    filters = {d: args[d] for d in DIMENSIONS if args.get(d)}
+    rows = dashboard_cubes.query(["Primary_Skill"], filters)
+    return bar_chart([r["Primary_Skill"] for r in rows], [r["count"] for r in rows],
+                     "Volunteers per Skill", ylabel="Count")
+
+def team_composition_chart(args):
+    # ?skill=Teaching&team_size=8&by=District (&seed=42 to chart a seeded /api/form_team team)
+    data = {"skill": args.get("skill"), "team_size": int(args.get("team_size", 5))}
+    for key in ("district", "radius_km", "date", "slot", "languages_mode", "seed", "strategy"):
+        if args.get(key):
+            data[key] = args[key]
+    if args.get("ngo_id"):
+        data["ngo_id"] = int(args["ngo_id"])
+    if args.get("languages"):
+        data["languages"] = [l.strip() for l in args["languages"].split(",") if l.strip()]
+    by = args.get("by", "Primary_Skill")
+    if by not in ("Primary_Skill", "District"):
+        raise ValueError("by must be Primary_Skill or District")
+    team = form_team_payload(data)
+    if isinstance(team, dict) and "error" in team:
+        raise ValueError(team["error"])
+    counts = Counter(member[by] for member in team).most_common()
+    return pie_chart([c[0] for c in counts], [c[1] for c in counts],
+                     "Team Composition by " + by.replace("_", " "))
+
+def engagement_chart(args):
+    # ?volunteer_id=12
+    data = volunteer_engagement_payload(int(args["volunteer_id"]))
+    return bar_chart(["Hours Logged", "Events Participated"],
+                     [data["hours_logged"], data["events_participated"]], "Volunteer Engagement")
+
+CHARTS = {
+    "skill_distribution": skill_distribution_chart,
+    "team_composition": team_composition_chart,
+    "engagement": engagement_chart,
+}
+
+# ------------------------------
+# API Endpoints
+# ------------------------------
+
+# Read-only JSON answers carry an ETag; a client that already holds that
+# version (If-None-Match) gets a bodyless 304. POST lookups are queries
+# here, so they are revalidated too; state-changing endpoints are not.
+UNCACHEABLE_ENDPOINTS = {"api_update_volunteer_stats", "api_admin_load", "api_record_activity"}
+
+# Admission control (see admission.py): clients are identified by address
+# (X-Client-ID only from trusted proxies), and may mark their own work
+# X-Priority: bulk.
+ADMISSION_EXEMPT = {None, "static", "api_admin_load"}
+
+@app.before_request
+def admit_request():
+    if request.endpoint in ADMISSION_EXEMPT:
+        return None
+    client = client_key(request.remote_addr, request.headers.get("X-Client-ID"))
+    priority = admission.priority_of(request.endpoint, request.headers.get("X-Priority"))
+    try:
+        admission.admit(client, request.endpoint, priority)
+    except Rejected as e:
+        response = jsonify({"error": e.reason})
+        response.status_code = e.status
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response
+    g.admitted_endpoint = request.endpoint
+    return None
+
+@app.teardown_request
+def release_request(exc=None):
+    endpoint = g.pop("admitted_endpoint", None)
+    if endpoint:
+        admission.release(endpoint)
+
+@app.after_request
+def add_etag(response):
+    if (response.status_code == 200 and response.mimetype == "application/json"
+            and request.endpoint not in UNCACHEABLE_ENDPOINTS):
+        response.add_etag()
+        if request.if_none_match.contains(response.get_etag()[0]):
+            response.status_code = 304
+            response.set_data(b"")
+    return response
+
+# Chart images: an unversioned URL redirects (no-cache) to the same URL
+# with ?v=<data version>, and versioned URLs are immutable, so browsers
+# keep them until the data changes.
+CHART_MAX_AGE = 365 * 24 * 3600
+CHART_RESERVED_ARGS = {"name", "fmt", "v"}
+
+@app.route("/api/charts/<name>.<fmt>", methods=["GET"])
+def api_chart(name, fmt):
+    if name not in CHARTS or fmt not in CHART_FORMATS:
+        return jsonify({"error": f"Unknown chart {name}.{fmt}", "charts": sorted(CHARTS),
+                        "formats": sorted(CHART_FORMATS)}), 404
+    # name/fmt/v are taken by the route itself and url_for reads _-prefixed
+    # keys (_scheme, _external, ...) as options: drop both from chart parameters
+    params = {k: v for k, v in request.args.items() if k not in CHART_RESERVED_ARGS and not k.startswith("_")}
+    version = data_version()
+    if request.args.get("v") != version:
+        response = redirect(url_for("api_chart", name=name, fmt=fmt, v=version, **params))
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+    try:
+        key, body = chart_cache.get_or_render(name, params, version, fmt, lambda: CHARTS[name](params))
+    except (KeyError, ValueError) as e:
+        return jsonify({"error": f"Bad chart parameters: {e}"}), 400
+    response = Response(body, mimetype=CHART_FORMATS[fmt])
+    response.set_etag(key)
+    response.headers["Cache-Control"] = f"public, max-age={CHART_MAX_AGE}, immutable"
+    return response.make_conditional(request)
+
+@app.route("/api/form_team", methods=["POST"])
+def api_form_team():
+    return jsonify(form_team_payload(request.get_json()))
+
+@app.route("/api/skilled_volunteers", methods=["POST"])
+def api_skilled_volunteers():
+    return jsonify(skilled_volunteers_payload(request.get_json()))
+
+@app.route("/api/showup_prediction", methods=["POST"])
+def api_showup_prediction():
+    return jsonify(showup_prediction_payload(request.get_json()))
 
 @app.route("/api/recommend_volunteers", methods=["POST"])
 def api_recommend_volunteers():
-    # Placeholder using random selection
-    top_n = request.get_json().get("top_n", 5)
-    return jsonify(fallback_selection(top_n=top_n))
+    return jsonify(recommend_volunteers_payload(request.get_json()))
 
 @app.route("/api/skill_gap", methods=["GET"])
 def api_skill_gap():
-    return jsonify({
-        "Counseling": "Recommended Counseling Workshop / Online Course",
-        "IT Support": "Recommended IT Support Workshop / Online Course",
-        "Logistics": "Recommended Logistics Workshop / Online Course"
-    })
+    return jsonify(skill_gap_payload())
 
 @app.route("/api/feedback_recommendations", methods=["POST"])
 def api_feedback_recommendations():
-    return jsonify({"recommendations": ["Workshop A", "Workshop B"]})
+    return jsonify(feedback_recommendations_payload(request.get_json(silent=True) or {}))
+
+@app.route("/api/dashboard_summary", methods=["GET"])
+def api_dashboard_summary():
+    return jsonify(dashboard_summary_payload(request.args))
+
+@app.route("/api/data_quality", methods=["GET"])
+def api_data_quality():
+    return jsonify(data_quality_payload())
 
 @app.route("/api/volunteer_engagement/<int:volunteer_id>", methods=["GET"])
 def api_volunteer_engagement(volunteer_id):
-    # Placeholder data
-    return jsonify({"hours_logged": 12, "events_participated": 3})
+    return jsonify(volunteer_engagement_payload(volunteer_id))
 
 @app.route("/api/training_suggestions/<int:volunteer_id>", methods=["GET"])
 def api_training_suggestions(volunteer_id):
-    # Placeholder data
-    return jsonify({"suggestions": ["First Aid Training", "Leadership Workshop"]})
+    return jsonify(training_suggestions_payload(volunteer_id))
+
+@app.route("/api/schedule_events", methods=["POST"])
+def api_schedule_events():
+    return jsonify(schedule_events_payload(request.get_json()))
+
+@app.route("/api/volunteer_stats/<int:volunteer_id>", methods=["POST"])
+def api_update_volunteer_stats(volunteer_id):
+    return jsonify(update_volunteer_stats_payload(volunteer_id, request.get_json()))
+
+@app.route("/api/activity", methods=["POST"])
+def api_record_activity():
+    return jsonify(record_activity_payload(request.get_json(silent=True) or {}))
+
+@app.route("/api/activity/volunteer/<int:volunteer_id>", methods=["GET"])
+def api_volunteer_activity(volunteer_id):
+    return jsonify(activity_windows_payload("volunteer", volunteer_id, request.args))
+
+@app.route("/api/activity/ngo/<int:ngo_id>", methods=["GET"])
+def api_ngo_activity(ngo_id):
+    return jsonify(activity_windows_payload("ngo", ngo_id, request.args))
+
+@app.route("/api/admin/load", methods=["GET"])
+def api_admin_load():
+    return jsonify(admission.stats())
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5001)
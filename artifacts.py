@@ -0,0 +1,271 @@
+# ------------------------------
+# artifacts.py - declarative model artifacts
+# ------------------------------
+# The pickles in models/ need the exact scikit-learn version that wrote them,
+# and unpickling runs arbitrary code. This module exports them to plain
+# arrays (.npy, loadable with allow_pickle=False and memory-mapped) and JSON,
+# described by a manifest with SHA-256 checksums:
+#
+#     python artifacts.py export    # models/*.pkl -> models/artifacts/
+#     python artifacts.py bench     # load time/memory vs joblib
+#
+# Loading needs only numpy, pandas and the standard library.
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+MODELS_DIR = "models"
+ARTIFACTS_DIR = os.path.join(MODELS_DIR, "artifacts")
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+PICKLES = [
+    "team_formation_model",
+    "skilled_volunteer_filter_function",
+    "nmf_feedback_model",
+    "tfidf_feedback_vectorizer",
+    "tfidf_volunteer_profiles",
+    "volunteer_engagement_df",
+    "skill_gap_training_suggestions",
+]
+
+
+class ArtifactError(Exception):
+    pass
+
+
+# ------------------------------
+# Loaded artifact types
+# ------------------------------
+class TfidfArtifact:
+    """TF-IDF transform rebuilt from a vocabulary, idf weights and stop words
+    (word analyzer, unigram only, as used by the exported vectorizers)."""
+
+    def __init__(self, vocabulary, idf, stop_words, params):
+        self.terms = vocabulary
+        self.vocabulary_ = {term: i for i, term in enumerate(vocabulary.tolist())}
+        self.idf_ = idf
+        self.stop_words = set(stop_words.tolist())
+        self.lowercase = params["lowercase"]
+        self.token_pattern = re.compile(params["token_pattern"])
+        self.norm = params["norm"]
+        self.sublinear_tf = params["sublinear_tf"]
+
+    def transform(self, documents):
+        out = np.zeros((len(documents), len(self.terms)))
+        for row, doc in enumerate(documents):
+            if self.lowercase:
+                doc = doc.lower()
+            for token in self.token_pattern.findall(doc):
+                col = self.vocabulary_.get(token)
+                if col is not None and token not in self.stop_words:
+                    out[row, col] += 1
+        if self.sublinear_tf:
+            np.log(out, where=out > 0, out=out)
+            out[out > 0] += 1
+        out *= self.idf_
+        if self.norm == "l2":
+            norms = np.linalg.norm(out, axis=1, keepdims=True)
+            np.divide(out, norms, where=norms > 0, out=out)
+        return out
+
+
+class NmfArtifact:
+    """Learned NMF topic matrix (components x features)."""
+
+    def __init__(self, components, params):
+        self.components_ = components
+        self.n_components = params["n_components"]
+
+
+class FunctionReference:
+    """A pickled function holds no learned state, only the name of a function
+    defined in the training notebook's __main__. It cannot be restored."""
+
+    def __init__(self, target):
+        self.target = target
+
+
+# ------------------------------
+# Export
+# ------------------------------
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _pickle_global(path):
+    # Read the module/name a pickled function points at without unpickling it
+    import pickletools
+    with open(path, "rb") as f:
+        strings = [arg for op, arg, _ in pickletools.genops(f) if isinstance(arg, str)]
+    return ".".join(strings[:2])
+
+
+def _column_array(series):
+    # Fixed-width unicode for text so the column loads without pickle
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series.to_numpy()
+    return np.asarray(series.astype(str).to_numpy(), dtype=str)
+
+
+def export_artifacts(src=MODELS_DIR, dst=ARTIFACTS_DIR):
+    """Convert the joblib pickles in ``src`` into arrays + JSON in ``dst``."""
+    import joblib
+
+    os.makedirs(dst, exist_ok=True)
+    manifest = {"format_version": FORMAT_VERSION, "artifacts": {}}
+
+    def save_array(name, part, array):
+        filename = f"{name}.{part}.npy"
+        np.save(os.path.join(dst, filename), np.ascontiguousarray(array), allow_pickle=False)
+        return filename
+
+    for name in PICKLES:
+        path = os.path.join(src, f"{name}.pkl")
+        if not os.path.exists(path):
+            continue
+        raw = open(path, "rb").read()
+        if b"__main__" in raw and len(raw) < 256:
+            manifest["artifacts"][name] = {"type": "function_reference", "target": _pickle_global(path), "files": {}}
+            continue
+
+        obj = joblib.load(path)
+        kind = type(obj).__name__
+        if kind == "TfidfVectorizer":
+            if obj.ngram_range != (1, 1) or obj.analyzer != "word":
+                raise ArtifactError(f"{name}: only unigram word TF-IDF can be exported")
+            terms = np.array(sorted(obj.vocabulary_, key=obj.vocabulary_.get))
+            entry = {"type": "tfidf", "files": {
+                "vocabulary": save_array(name, "vocabulary", terms),
+                "idf": save_array(name, "idf", obj.idf_),
+                "stop_words": save_array(name, "stop_words", np.array(sorted(obj.get_stop_words() or []), dtype=str)),
+            }, "params": {
+                "lowercase": obj.lowercase, "token_pattern": obj.token_pattern,
+                "norm": obj.norm, "sublinear_tf": obj.sublinear_tf,
+            }}
+        elif kind == "NMF":
+            entry = {"type": "nmf", "files": {
+                "components": save_array(name, "components", obj.components_),
+            }, "params": {"n_components": int(obj.n_components_)}}
+        elif isinstance(obj, pd.DataFrame):
+            entry = {"type": "table", "files": {
+                column: save_array(name, column, _column_array(obj[column]))
+                for column in obj.columns
+            }}
+        elif isinstance(obj, dict):
+            filename = f"{name}.json"
+            with open(os.path.join(dst, filename), "w") as f:
+                json.dump(obj, f, indent=2, sort_keys=True)
+            entry = {"type": "mapping", "files": {"mapping": filename}}
+        else:
+            raise ArtifactError(f"{name}: don't know how to export {kind}")
+
+        entry["sha256"] = {f: _sha256(os.path.join(dst, f)) for f in entry["files"].values()}
+        manifest["artifacts"][name] = entry
+
+    with open(os.path.join(dst, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+# ------------------------------
+# Load
+# ------------------------------
+def load_artifacts(directory=ARTIFACTS_DIR, verify=True, mmap=True):
+    """Load every artifact listed in the manifest; arrays are memory-mapped."""
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ArtifactError(f"Unsupported artifact format {manifest.get('format_version')}")
+
+    loaded = {}
+    for name, entry in manifest["artifacts"].items():
+        files = {part: os.path.join(directory, f) for part, f in entry["files"].items()}
+        if verify:
+            for f in entry["files"].values():
+                if _sha256(os.path.join(directory, f)) != entry["sha256"][f]:
+                    raise ArtifactError(f"Checksum mismatch for {f}")
+
+        def array(part):
+            return np.load(files[part], mmap_mode="r" if mmap else None, allow_pickle=False)
+
+        kind = entry["type"]
+        if kind == "tfidf":
+            loaded[name] = TfidfArtifact(array("vocabulary"), array("idf"), array("stop_words"), entry["params"])
+        elif kind == "nmf":
+            loaded[name] = NmfArtifact(array("components"), entry["params"])
+        elif kind == "table":
+            loaded[name] = pd.DataFrame({column: array(column) for column in files})
+        elif kind == "mapping":
+            with open(files["mapping"]) as f:
+                loaded[name] = json.load(f)
+        elif kind == "function_reference":
+            loaded[name] = FunctionReference(entry["target"])
+        else:
+            raise ArtifactError(f"{name}: unknown artifact type {kind}")
+    return loaded
+
+
+# ------------------------------
+# Benchmark
+# ------------------------------
+def _measure(load, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        load()
+    elapsed = (time.perf_counter() - start) / repeat
+    # Separate pass: tracemalloc itself slows allocation-heavy loaders
+    tracemalloc.start()
+    load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark(src=MODELS_DIR, dst=ARTIFACTS_DIR, repeat=20):
+    import warnings
+    import joblib
+
+    def joblib_path():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for name in PICKLES:
+                try:
+                    joblib.load(os.path.join(src, f"{name}.pkl"))
+                except Exception:
+                    pass  # pickled functions only load inside the training notebook
+
+    joblib_path()  # warm imports so neither side pays for them
+    load_artifacts(dst)
+    rows = [
+        ("joblib.load (pickles)", *_measure(joblib_path, repeat)),
+        ("load_artifacts (verify + mmap)", *_measure(lambda: load_artifacts(dst), repeat)),
+        ("load_artifacts (mmap, no verify)", *_measure(lambda: load_artifacts(dst, verify=False), repeat)),
+    ]
+    for label, seconds, peak in rows:
+        print(f"{label:34s} {seconds * 1000:8.2f} ms   peak {peak / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export or benchmark model artifacts")
+    parser.add_argument("command", choices=["export", "bench"])
+    parser.add_argument("--src", default=MODELS_DIR)
+    parser.add_argument("--dst", default=ARTIFACTS_DIR)
+    args = parser.parse_args()
+    if args.command == "export":
+        manifest = export_artifacts(args.src, args.dst)
+        print(f"Exported {len(manifest['artifacts'])} artifacts to {args.dst}")
+    else:
+        benchmark(args.src, args.dst)
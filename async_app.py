@@ -0,0 +1,111 @@
+# ------------------------------
+# async_app.py - asyncio variant of the SevaSetu API
+# ------------------------------
+# Serves the same routes and JSON shapes as app.py, reusing its request
+# handlers. Lightweight lookups run directly on the event loop; model
+# inference and dataframe filtering are offloaded to a process pool so a
+# slow team formation never blocks dashboard or kiosk clients.
+#
+# Endpoints that mutate in-memory state (e.g. /api/volunteer_stats) are only
+# served by app.py: each pool worker holds its own copy of the data. So are
+# the chart images (/api/charts), whose render cache lives in that process,
+# and the activity log endpoints (/api/activity), whose windows it updates.
+# Admission control (admission.py) is likewise wired into app.py only; here
+# the process pool already bounds concurrent heavy work.
+#
+# Run with an ASGI server, e.g.:
+#     hypercorn async_app:app --bind 0.0.0.0:5001
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from quart import Quart, request, jsonify
+
+import app as core
+
+app = Quart(__name__)
+
+# Number of worker processes for CPU-heavy handlers (0 = one per core)
+WORKERS = int(os.environ.get("SEVASETU_WORKERS", "0")) or None
+
+process_pool = None
+
+# ------------------------------
+# Process pool lifecycle
+# ------------------------------
+def _warm_worker():
+    # Each worker imports app.py once, loading the dataset and models
+    # before the first request reaches it.
+    import app  # noqa: F401
+
+@app.before_serving
+async def start_pool():
+    global process_pool
+    process_pool = ProcessPoolExecutor(max_workers=WORKERS, initializer=_warm_worker)
+
+@app.after_serving
+async def stop_pool():
+    process_pool.shutdown(wait=False, cancel_futures=True)
+
+async def run_in_pool(handler, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(process_pool, handler, *args)
+
+async def json_body():
+    return await request.get_json(silent=True) or {}
+
+# ------------------------------
+# API Endpoints (CPU-heavy, process pool)
+# ------------------------------
+
+@app.route("/api/form_team", methods=["POST"])
+async def api_form_team():
+    return jsonify(await run_in_pool(core.form_team_payload, await json_body()))
+
+@app.route("/api/skilled_volunteers", methods=["POST"])
+async def api_skilled_volunteers():
+    return jsonify(await run_in_pool(core.skilled_volunteers_payload, await json_body()))
+
+@app.route("/api/showup_prediction", methods=["POST"])
+async def api_showup_prediction():
+    return jsonify(await run_in_pool(core.showup_prediction_payload, await json_body()))
+
+@app.route("/api/recommend_volunteers", methods=["POST"])
+async def api_recommend_volunteers():
+    return jsonify(await run_in_pool(core.recommend_volunteers_payload, await json_body()))
+
+@app.route("/api/feedback_recommendations", methods=["POST"])
+async def api_feedback_recommendations():
+    return jsonify(await run_in_pool(core.feedback_recommendations_payload, await json_body()))
+
+@app.route("/api/schedule_events", methods=["POST"])
+async def api_schedule_events():
+    return jsonify(await run_in_pool(core.schedule_events_payload, await json_body()))
+
+# ------------------------------
+# API Endpoints (lightweight, event loop)
+# ------------------------------
+
+@app.route("/api/skill_gap", methods=["GET"])
+async def api_skill_gap():
+    return jsonify(core.skill_gap_payload())
+
+@app.route("/api/dashboard_summary", methods=["GET"])
+async def api_dashboard_summary():
+    return jsonify(core.dashboard_summary_payload(request.args))
+
+@app.route("/api/data_quality", methods=["GET"])
+async def api_data_quality():
+    return jsonify(core.data_quality_payload())
+
+@app.route("/api/volunteer_engagement/<int:volunteer_id>", methods=["GET"])
+async def api_volunteer_engagement(volunteer_id):
+    return jsonify(core.volunteer_engagement_payload(volunteer_id))
+
+@app.route("/api/training_suggestions/<int:volunteer_id>", methods=["GET"])
+async def api_training_suggestions(volunteer_id):
+    return jsonify(core.training_suggestions_payload(volunteer_id))
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=5001)
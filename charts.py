@@ -0,0 +1,110 @@
+# ------------------------------
+# charts.py - server-side chart rendering
+# ------------------------------
+# Charts are drawn with matplotlib's Agg canvas (no pyplot, no display, safe
+# to use from request threads) and stored in a content-addressed cache: the
+# key is a SHA-256 of the chart name, its parameters, the data version and
+# the output format. The same key is the response ETag, so a versioned chart
+# URL never changes content and can be cached by clients indefinitely.
+
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+
+COLOR = "#80cbc4"
+DEFAULT_CACHE_ENTRIES = 256
+
+
+# ------------------------------
+# Drawing
+# ------------------------------
+def _figure(title, figsize=(6, 3.5)):
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_title(title)
+    return fig, ax
+
+
+def _no_data(ax):
+    ax.text(0.5, 0.5, "No data", ha="center", va="center", transform=ax.transAxes, color="gray")
+    ax.set_axis_off()
+
+
+def bar_chart(labels, values, title, ylabel=None):
+    fig, ax = _figure(title)
+    if not labels:
+        _no_data(ax)
+        return fig
+    ax.bar(range(len(labels)), values, color=COLOR)
+    rotate = len(labels) > 3
+    ax.set_xticks(range(len(labels)), labels, rotation=45 if rotate else 0, ha="right" if rotate else "center")
+    if ylabel:
+        ax.set_ylabel(ylabel)
+    fig.tight_layout()
+    return fig
+
+
+def pie_chart(labels, values, title):
+    fig, ax = _figure(title)
+    if not labels:
+        _no_data(ax)
+        return fig
+    ax.pie(values, labels=labels, autopct="%1.1f%%", startangle=90,
+           colors=matplotlib.colormaps["Pastel1"].colors)
+    fig.tight_layout()
+    return fig
+
+
+def render(fig, fmt):
+    buf = io.BytesIO()
+    # No creation date in the metadata, so the same figure gives the same bytes
+    metadata = {"Software": None} if fmt == "png" else {"Date": None}
+    fig.savefig(buf, format=fmt, metadata=metadata)
+    return buf.getvalue()
+
+
+# ------------------------------
+# Content-addressed cache
+# ------------------------------
+def chart_key(name, params, version, fmt):
+    spec = json.dumps([name, params, version, fmt], sort_keys=True, default=str)
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
+
+class ChartCache:
+    """LRU of rendered charts by chart_key; ``draw()`` builds the figure on a miss."""
+
+    def __init__(self, max_entries=DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, name, params, version, fmt, draw):
+        key = chart_key(name, params, version, fmt)
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return key, body
+            self.misses += 1
+
+        # Render outside the lock; a concurrent miss on the same key just
+        # renders the identical image twice
+        body = render(draw(), fmt)
+        with self._lock:
+            self._entries[key] = body
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return key, body
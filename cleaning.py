@@ -0,0 +1,292 @@
+# ------------------------------
+# cleaning.py - load-time validation and cleaning of volunteer CSVs
+# ------------------------------
+# The CSV is read in chunks with every column as text, then each chunk is
+# normalized and validated with vectorized pandas operations: whitespace and
+# casing are canonicalized, numbers parsed and range-checked, phone numbers
+# reduced to 10 digits. Rows that fail are quarantined (optionally streamed
+# to a CSV) with a reason instead of leaking into every request; a bad phone
+# number alone doesn't make a volunteer unusable, so it is only blanked and
+# counted in the report's "values_nulled". Duplicate
+# Volunteer_IDs are dropped after the last chunk, and low-cardinality text
+# columns become categoricals so queries can compare values exactly.
+
+import math
+import re
+
+import numpy as np
+import pandas as pd
+
+from geo import canonical_district
+
+DEFAULT_CHUNKSIZE = 100_000
+
+NUMERIC_COLUMNS = {
+    # column: (min, max) inclusive
+    "Volunteer_ID": (1, None),
+    "Age": (16, 100),
+    "Experience_Years": (0, 80),
+    "NGO_ID": (0, None),
+    "Volunteers_Needed": (0, None),
+    "Match_Status": (0, 1),
+    "Showed_Up": (0, 1),
+    "Volunteer_Hours": (0, 24 * 365),
+    "Satisfaction_Rating": (1, 5),
+}
+
+# Must be whole numbers: IDs, counts and 0/1 flags. Others (hours, ratings,
+# age, experience) may be fractional
+INTEGER_COLUMNS = {"Volunteer_ID", "NGO_ID", "Volunteers_Needed", "Match_Status", "Showed_Up"}
+
+PHONE_COLUMNS = ["Emergency_Contact", "Contact"]
+
+CATEGORICAL_COLUMNS = [
+    "Gender", "District", "Availability", "Primary_Skill", "Secondary_Skill",
+    "Languages_Known", "Past_NGO_Work", "Blood_Group", "Training_Completed",
+    "NGO_Name", "Category", "Address",
+]
+
+# Placeholders treated as missing
+NA_VALUES = ["", "NA", "N/A", "None", "null", "NULL", "nan", "NaN", "-"]
+
+BLOOD_GROUPS = {"A+", "A-", "B+", "B-", "AB+", "AB-", "O+", "O-"}
+
+# Indian 10-digit national numbers: mobiles (6-9...) and landlines (STD code
+# + subscriber number, e.g. 020-25531234 -> 2025531234)
+PHONE_PATTERN = re.compile(r"[2-9]\d{9}")
+
+TRAINING_VALUES = {"yes": "Yes", "y": "Yes", "true": "Yes", "1": "Yes",
+                   "no": "No", "n": "No", "false": "No", "0": "No"}
+
+# Canonical spellings; values are matched case-insensitively
+GENDERS = ["Female", "Male", "Other"]
+AVAILABILITY = ["Weekdays", "Weekends", "Evenings", "Flexible", "Full-time"]
+SKILLS = ["Logistics", "Teaching", "Medical Assistance", "Counseling", "IT Support",
+          "Fundraising", "Event Management", "Sports Coaching", "Driving",
+          "Music Therapy", "Photography", "Social Media", "Cooking", "First Aid"]
+
+REQUIRED_COLUMNS = ["Volunteer_ID", "Volunteer_Name", "District", "Primary_Skill"]
+
+
+# ------------------------------
+# Normalization helpers
+# ------------------------------
+# Rosters repeat a small set of districts, skills, blood groups..., so each
+# helper normalizes the *distinct* values of a column once and broadcasts the
+# result back to the rows with the factorized codes.
+
+def _map_unique(series, func):
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    mapped[:-1] = [func(u) for u in uniques]
+    mapped[-1] = None  # code -1: missing
+    return pd.Series(mapped[codes], index=series.index, dtype=object)
+
+
+def _numeric(series):
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    parsed = np.append(pd.to_numeric(pd.Series(uniques, dtype=object), errors="coerce").to_numpy(float), np.nan)
+    return pd.Series(parsed[codes], index=series.index)
+
+
+def _squash(series):
+    # Trim and collapse runs of whitespace; empty strings become missing
+    return _map_unique(series, lambda v: " ".join(v.split()) or None)
+
+
+def _canonical(series, choices):
+    # Case-insensitive match onto canonical spellings, unknown values title-cased
+    lookup = {c.lower(): c for c in choices}
+    return _map_unique(series, lambda v: lookup.get(v.lower(), v.title()))
+
+
+def _districts(series):
+    return _map_unique(series, lambda v: canonical_district(v) or v.title())
+
+
+def _phone(value):
+    digits = re.sub(r"\D", "", value)
+    # Drop +91 / 0 trunk prefixes
+    if len(digits) == 12 and digits.startswith("91"):
+        digits = digits[2:]
+    elif len(digits) == 11 and digits.startswith("0"):
+        digits = digits[1:]
+    return digits if PHONE_PATTERN.fullmatch(digits) else None
+
+
+def _blood_group(value):
+    value = value.upper().replace(" ", "").replace("POSITIVE", "+").replace("NEGATIVE", "-").replace("VE", "")
+    return value if value in BLOOD_GROUPS else None
+
+
+def _languages(value):
+    return ", ".join(part.strip() for part in re.split(r"[,;/]", value.lower()) if part.strip())
+
+
+def numeric_value(column, value):
+    """``value`` as a number within the NUMERIC_COLUMNS bounds of ``column``
+    (whole for INTEGER_COLUMNS), or None."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    low, high = NUMERIC_COLUMNS[column]
+    if not math.isfinite(number) or (low is not None and number < low) or (high is not None and number > high):
+        return None
+    if column in INTEGER_COLUMNS and not number.is_integer():
+        return None
+    return number
+
+
+def training_value(value):
+    """Canonical "Yes"/"No" for a Training_Completed value, or None."""
+    return TRAINING_VALUES.get(str(value).strip().lower())
+
+
+def matching_categories(series, query):
+    """Categories of ``series`` containing ``query`` (case-insensitive), for an
+    exact ``isin`` filter instead of a per-row substring scan."""
+    query = query.strip().lower()
+    values = series.cat.categories if isinstance(series.dtype, pd.CategoricalDtype) else series.dropna().unique()
+    return [v for v in values if query in str(v).lower()]
+
+
+# ------------------------------
+# Chunk cleaning
+# ------------------------------
+def clean_chunk(chunk):
+    """Normalize and validate one chunk of raw (all-text) rows.
+
+    Returns ``(clean, quarantined, nulled)``; quarantined rows keep their raw
+    values plus a ``Quarantine_Reason`` column, and ``nulled`` counts values
+    blanked in otherwise clean rows, by reason.
+    """
+    raw = chunk
+    chunk = chunk.copy()
+    reasons = pd.Series("", index=chunk.index, dtype=object)
+    nulled = {}
+
+    def flag(bad, reason):
+        nonlocal reasons
+        reasons = reasons.where(~bad, reasons + np.where(reasons == "", "", "; ") + reason)
+
+    for column in chunk.columns:
+        if chunk[column].dtype == object or pd.api.types.is_string_dtype(chunk[column]):
+            chunk[column] = _squash(chunk[column])
+
+    for column in REQUIRED_COLUMNS:
+        if column in chunk:
+            flag(chunk[column].isna(), f"missing {column}")
+
+    for column, (low, high) in NUMERIC_COLUMNS.items():
+        if column not in chunk:
+            continue
+        values = _numeric(chunk[column])
+        bad = values.isna() & chunk[column].notna()
+        if column in INTEGER_COLUMNS:
+            bad |= values.notna() & (values != values.round())
+        if low is not None:
+            bad |= values < low
+        if high is not None:
+            bad |= values > high
+        flag(bad, f"bad {column}")
+        values = values.where(~bad)
+        chunk[column] = values.astype("Int64") if column in INTEGER_COLUMNS else values
+
+    for column in PHONE_COLUMNS:
+        if column in chunk:
+            phones = _map_unique(chunk[column], _phone)
+            invalid = chunk[column].notna() & phones.isna()
+            chunk[column] = phones
+            nulled[f"bad {column}"] = invalid
+
+    if "Blood_Group" in chunk:
+        groups = _map_unique(chunk["Blood_Group"], _blood_group)
+        flag(chunk["Blood_Group"].notna() & groups.isna(), "bad Blood_Group")
+        chunk["Blood_Group"] = groups
+
+    if "Training_Completed" in chunk:
+        trained = _map_unique(chunk["Training_Completed"], training_value)
+        flag(chunk["Training_Completed"].notna() & trained.isna(), "bad Training_Completed")
+        chunk["Training_Completed"] = trained
+
+    for column in ("District", "Address"):
+        if column in chunk:
+            chunk[column] = _districts(chunk[column])
+    if "Gender" in chunk:
+        chunk["Gender"] = _canonical(chunk["Gender"], GENDERS)
+    if "Availability" in chunk:
+        chunk["Availability"] = _canonical(chunk["Availability"], AVAILABILITY)
+    for column in ("Primary_Skill", "Secondary_Skill"):
+        if column in chunk:
+            chunk[column] = _canonical(chunk[column], SKILLS)
+    if "Languages_Known" in chunk:
+        chunk["Languages_Known"] = _map_unique(chunk["Languages_Known"], _languages)
+
+    bad = reasons != ""
+    quarantined = raw[bad].assign(Quarantine_Reason=reasons[bad])
+    nulled = {reason: int((invalid & ~bad).sum()) for reason, invalid in nulled.items()}
+    return chunk[~bad], quarantined, {reason: n for reason, n in nulled.items() if n}
+
+
+def finalize(frames):
+    """Concatenate cleaned chunks, drop duplicate Volunteer_IDs (first wins)
+    and convert text columns to categoricals. Returns ``(df, duplicates)``."""
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    duplicates = df.iloc[0:0]
+    if "Volunteer_ID" in df:
+        dup = df["Volunteer_ID"].duplicated(keep="first")
+        duplicates = df[dup].assign(Quarantine_Reason="duplicate Volunteer_ID")
+        df = df[~dup].reset_index(drop=True)
+    for column in INTEGER_COLUMNS:
+        if column in df and not df[column].isna().any():
+            df[column] = df[column].astype("int64")
+    for column in CATEGORICAL_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype("category")
+    return df, duplicates
+
+
+def empty_report():
+    return {"rows_read": 0, "rows_clean": 0, "rows_quarantined": 0, "reasons": {}, "values_nulled": {}}
+
+
+def record_nulled(report, nulled):
+    for reason, count in nulled.items():
+        report["values_nulled"][reason] = report["values_nulled"].get(reason, 0) + count
+
+
+def record_quarantine(report, quarantined, quarantine_path=None):
+    if quarantined.empty:
+        return
+    report["rows_quarantined"] += len(quarantined)
+    counts = quarantined["Quarantine_Reason"].str.split("; ").explode().value_counts()
+    for reason, count in counts.items():
+        report["reasons"][reason] = report["reasons"].get(reason, 0) + int(count)
+    if quarantine_path:
+        header = not report.get("_quarantine_written")
+        quarantined.to_csv(quarantine_path, mode="w" if header else "a", header=header, index=False)
+        report["_quarantine_written"] = True
+
+
+def clean_volunteer_csv(path, chunksize=DEFAULT_CHUNKSIZE, quarantine_path=None):
+    """Stream ``path`` through the cleaning pipeline chunk by chunk.
+
+    Returns ``(df, report)``. Bad rows are appended to ``quarantine_path``
+    (if given) as they are found, so raw chunks never accumulate in memory.
+    """
+    report = empty_report()
+    frames = []
+    for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, na_values=NA_VALUES,
+                             chunksize=chunksize):
+        report["rows_read"] += len(chunk)
+        clean, quarantined, nulled = clean_chunk(chunk)
+        frames.append(clean)
+        record_quarantine(report, quarantined, quarantine_path)
+        record_nulled(report, nulled)
+
+    df, duplicates = finalize(frames)
+    record_quarantine(report, duplicates, quarantine_path)
+    report.pop("_quarantine_written", None)
+    report["rows_clean"] = len(df)
+    return df, report
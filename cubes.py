@@ -0,0 +1,107 @@
+# ------------------------------
+# cubes.py - pre-aggregated dashboard cubes
+# ------------------------------
+# Counts, hours, show-ups and satisfaction are pre-aggregated for every
+# combination (cuboid) of the dashboard dimensions, i.e. all 2^5 group-bys
+# of District x Primary_Skill x Category x Gender x Availability. Any slice
+# or rollup is then a lookup in one small cuboid instead of a groupby over
+# the volunteer table, and a changed row is applied as a +/- delta to each
+# cuboid.
+
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = ["District", "Primary_Skill", "Category", "Gender", "Availability"]
+
+# Measure columns summed per cell (count is the number of volunteers)
+MEASURES = ["count", "hours", "showed_up", "satisfaction"]
+MEASURE_SOURCES = {"hours": "Volunteer_Hours", "showed_up": "Showed_Up", "satisfaction": "Satisfaction_Rating"}
+
+
+def _cell_values(sums):
+    count, hours, showed_up, satisfaction = (float(x) for x in sums)
+    return {
+        "count": int(count),
+        "hours": hours,
+        "show_up_rate": round(showed_up / count, 4) if count else None,
+        "avg_satisfaction": round(satisfaction / count, 4) if count else None,
+    }
+
+
+class DashboardCubes:
+    """Every group-by of DIMENSIONS, keyed by the tuple of grouped dimensions."""
+
+    def __init__(self, df):
+        frame = pd.DataFrame({dim: df[dim].astype("string").fillna("Unknown") for dim in DIMENSIONS})
+        frame["count"] = 1
+        for measure, column in MEASURE_SOURCES.items():
+            frame[measure] = pd.to_numeric(df[column], errors="coerce").fillna(0).astype(float)
+
+        # Base cuboid from the table, every coarser one rolled up from it
+        finest = frame.groupby(DIMENSIONS, sort=False, observed=True)[MEASURES].sum()
+        self.cuboids = {}
+        for size in range(len(DIMENSIONS) + 1):
+            for dims in combinations(DIMENSIONS, size):
+                if dims:
+                    rolled = finest.groupby(level=list(dims), sort=False).sum()
+                    keys = [k if isinstance(k, tuple) else (k,) for k in rolled.index]
+                    self.cuboids[dims] = {k: row for k, row in zip(keys, rolled.to_numpy())}
+                else:
+                    self.cuboids[dims] = {(): finest.to_numpy().sum(axis=0)}
+
+        self.values = {dim: {v.lower(): v for v in frame[dim].unique()} for dim in DIMENSIONS}
+        self.version = 0
+
+    # ------------------------------
+    # Incremental maintenance
+    # ------------------------------
+    def _apply(self, row, sign):
+        labels = {dim: str(row.get(dim) if pd.notna(row.get(dim)) else "Unknown") for dim in DIMENSIONS}
+        delta = sign * np.array([1.0] + [float(row.get(MEASURE_SOURCES[m]) or 0) for m in MEASURES[1:]])
+        for dims, cells in self.cuboids.items():
+            key = tuple(labels[d] for d in dims)
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = delta.copy()
+            else:
+                cell += delta
+                if cell[0] <= 0:
+                    del cells[key]
+        for dim in DIMENSIONS:
+            self.values[dim].setdefault(labels[dim].lower(), labels[dim])
+
+    def add(self, row):
+        self._apply(row, 1)
+        self.version += 1
+
+    def remove(self, row):
+        self._apply(row, -1)
+        self.version += 1
+
+    def replace(self, old_row, new_row):
+        self._apply(old_row, -1)
+        self._apply(new_row, 1)
+        self.version += 1
+
+    # ------------------------------
+    # Queries
+    # ------------------------------
+    def query(self, group_by=(), filters=None):
+        """Rows of aggregated measures grouped by ``group_by`` dimensions,
+        restricted to cells matching ``filters`` ({dimension: value})."""
+        filters = filters or {}
+        unknown = [d for d in list(group_by) + list(filters) if d not in DIMENSIONS]
+        if unknown:
+            raise KeyError(f"Unknown dimension(s): {', '.join(unknown)}")
+        wanted = {d: self.values[d].get(str(v).strip().lower(), str(v)) for d, v in filters.items()}
+        dims = tuple(d for d in DIMENSIONS if d in group_by or d in wanted)
+
+        rows = []
+        for key, sums in self.cuboids[dims].items():
+            labels = dict(zip(dims, key))
+            if all(labels[d] == v for d, v in wanted.items()):
+                rows.append({**{d: labels[d] for d in dims if d in group_by}, **_cell_values(sums)})
+        rows.sort(key=lambda r: -r["count"])
+        return rows
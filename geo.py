@@ -0,0 +1,161 @@
+# ------------------------------
+# geo.py - district proximity index for nearest-volunteer search
+# ------------------------------
+# Volunteers and NGOs are only located by district name, so proximity is
+# measured between district headquarters. A BallTree on haversine distance
+# answers arbitrary lat/lon queries; district-to-district orderings are
+# precomputed so "k nearest qualified volunteers to Satara" only walks a
+# few small row arrays.
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+
+EARTH_RADIUS_KM = 6371.0
+
+# District headquarters (lat, lon) for all 36 districts of Maharashtra
+DISTRICT_CENTROIDS = {
+    "Ahmednagar": (19.0952, 74.7496),
+    "Akola": (20.7002, 77.0082),
+    "Amravati": (20.9374, 77.7796),
+    "Aurangabad": (19.8762, 75.3433),
+    "Beed": (18.9891, 75.7601),
+    "Bhandara": (21.1669, 79.6500),
+    "Buldhana": (20.5293, 76.1842),
+    "Chandrapur": (19.9615, 79.2961),
+    "Dhule": (20.9042, 74.7749),
+    "Gadchiroli": (20.1849, 79.9948),
+    "Gondia": (21.4602, 80.1920),
+    "Hingoli": (19.7173, 77.1494),
+    "Jalgaon": (21.0077, 75.5626),
+    "Jalna": (19.8347, 75.8816),
+    "Kolhapur": (16.7050, 74.2433),
+    "Latur": (18.4088, 76.5604),
+    "Mumbai": (18.9388, 72.8354),
+    "Mumbai Suburban": (19.0596, 72.8295),
+    "Nagpur": (21.1458, 79.0882),
+    "Nanded": (19.1383, 77.3210),
+    "Nandurbar": (21.3700, 74.2400),
+    "Nashik": (19.9975, 73.7898),
+    "Osmanabad": (18.1860, 76.0419),
+    "Palghar": (19.6967, 72.7699),
+    "Parbhani": (19.2608, 76.7748),
+    "Pune": (18.5204, 73.8567),
+    "Raigad": (18.6414, 72.8722),
+    "Ratnagiri": (16.9902, 73.3120),
+    "Sangli": (16.8524, 74.5815),
+    "Satara": (17.6805, 74.0183),
+    "Sindhudurg": (16.1390, 73.6830),
+    "Solapur": (17.6599, 75.9064),
+    "Thane": (19.2183, 72.9781),
+    "Wardha": (20.7453, 78.6022),
+    "Washim": (20.1110, 77.1330),
+    "Yavatmal": (20.3888, 78.1204),
+}
+
+# Renamed districts and common alternate spellings
+DISTRICT_ALIASES = {
+    "Chhatrapati Sambhajinagar": "Aurangabad",
+    "Sambhajinagar": "Aurangabad",
+    "Dharashiv": "Osmanabad",
+    "Ahilyanagar": "Ahmednagar",
+    "Bombay": "Mumbai",
+    "Poona": "Pune",
+    "Gondiya": "Gondia",
+    "Bid": "Beed",
+}
+
+
+def canonical_district(name):
+    if not isinstance(name, str):
+        return None
+    name = " ".join(name.split()).title()
+    name = DISTRICT_ALIASES.get(name, name)
+    return name if name in DISTRICT_CENTROIDS else None
+
+
+class DistrictIndex:
+    """Spatial index over volunteers keyed by (district, primary skill)."""
+
+    def __init__(self, df):
+        self.names = list(DISTRICT_CENTROIDS)
+        coords = np.radians([DISTRICT_CENTROIDS[n] for n in self.names])
+        self.tree = BallTree(coords, metric="haversine")
+
+        # District -> every district ordered by distance (km), nearest first
+        dist, idx = self.tree.query(coords, k=len(self.names))
+        self.rings = {
+            self.names[i]: ([self.names[j] for j in idx[i]], dist[i] * EARTH_RADIUS_KM)
+            for i in range(len(self.names))
+        }
+
+        # (district, skill) -> positional row numbers into df
+        districts = df["District"].map(canonical_district)
+        skills = df["Primary_Skill"].astype("string").fillna("").str.strip()
+        groups = (
+            pd.DataFrame({"district": districts.to_numpy(), "skill": skills.to_numpy()})
+            .dropna(subset=["district"])
+            .groupby(["district", "skill"], sort=False)
+            .indices
+        )
+        self.rows = {key: np.asarray(pos, dtype=np.int64) for key, pos in groups.items()}
+        self.skills = sorted({skill for _, skill in self.rows})
+
+    def nearest_districts(self, lat, lon, k=1):
+        dist, idx = self.tree.query(np.radians([[lat, lon]]), k=min(k, len(self.names)))
+        return [(self.names[j], float(d * EARTH_RADIUS_KM)) for j, d in zip(idx[0], dist[0])]
+
+    def matching_skills(self, skill):
+        if not skill:
+            return self.skills
+        skill = skill.strip().lower()
+        return [s for s in self.skills if skill in s.lower()]
+
+    def nearest_volunteers(self, district, k, skill=None, radius_km=None, order_key=None, mask=None):
+        """Return (row positions, distances in km) of the k nearest volunteers
+        whose primary skill matches ``skill``, optionally within ``radius_km``
+        and restricted to rows where the boolean ``mask`` is set.
+
+        ``order_key`` (an array aligned with df rows, higher is better) decides
+        the order among volunteers of the same district.
+        """
+        center = canonical_district(district)
+        if center is None or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        skills = self.matching_skills(skill)
+        ring_names, ring_dist = self.rings[center]
+
+        picked, distances, found = [], [], 0
+        for name, d in zip(ring_names, ring_dist):
+            if radius_km is not None and d > radius_km:
+                break
+            parts = [self.rows[(name, s)] for s in skills if (name, s) in self.rows]
+            if not parts:
+                continue
+            rows = np.concatenate(parts) if len(parts) > 1 else parts[0]
+            if mask is not None:
+                rows = rows[mask[rows]]
+            if order_key is not None:
+                rows = rows[np.argsort(-order_key[rows], kind="stable")]
+            else:
+                rows = np.sort(rows)
+            rows = rows[: k - found]
+            if not len(rows):
+                continue
+            picked.append(rows)
+            distances.append(np.full(len(rows), d))
+            found += len(rows)
+            if found >= k:
+                break
+
+        if not picked:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        return np.concatenate(picked), np.concatenate(distances)
+
+
+def ngo_district(df, ngo_id):
+    """Most common NGO Address for an NGO_ID, as a canonical district."""
+    addresses = df.loc[df["NGO_ID"] == ngo_id, "Address"]
+    if addresses.empty:
+        return None
+    return canonical_district(addresses.mode().iat[0])
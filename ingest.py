@@ -0,0 +1,145 @@
+# ------------------------------
+# ingest.py - parallel chunked CSV ingestion
+# ------------------------------
+# Large rosters are split into byte ranges that start and end on line
+# boundaries. Each range is parsed (all columns as str) and run through
+# cleaning.clean_chunk on a process pool, then the cleaned chunks are merged
+# in file order and deduplicated by cleaning.finalize.
+#
+# Ranges are cut at newlines, so quoted fields must not contain line breaks
+# (true for the volunteer exports this app reads).
+#
+#     python ingest.py bench --rows 1000000    # speedup vs worker count
+
+import argparse
+import csv
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from cleaning import NA_VALUES, clean_chunk, empty_report, finalize, record_nulled, record_quarantine
+
+DEFAULT_CHUNK_BYTES = 32 * 1024 * 1024
+
+
+def byte_ranges(path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Return (header, [(start, end), ...]) with every range on line boundaries."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline()
+        ranges = []
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()  # run on to the end of the current line
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    # utf-8-sig drops the byte-order mark Excel puts before the first column name
+    return next(csv.reader([header.decode("utf-8-sig")])), ranges
+
+
+def parse_range(path, start, end, columns):
+    """Parse and clean one byte range; runs in a worker process."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    chunk = pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype=str,
+                        keep_default_na=False, na_values=NA_VALUES)
+    clean, quarantined, nulled = clean_chunk(chunk)
+    return len(chunk), clean, quarantined, nulled
+
+
+def ingest_csv(path, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES, progress=None, quarantine_path=None):
+    """Load and clean ``path`` in parallel.
+
+    ``progress(bytes_done, bytes_total)`` is called as chunks complete.
+    Returns ``(df, report)`` like cleaning.clean_volunteer_csv.
+    """
+    columns, ranges = byte_ranges(path, chunk_bytes)
+    total = sum(end - start for start, end in ranges)
+    report = empty_report()
+    results = [None] * len(ranges)
+    done = 0
+
+    if workers == 1 or len(ranges) <= 1:
+        # Not worth a process pool
+        for i, (start, end) in enumerate(ranges):
+            results[i] = parse_range(path, start, end, columns)
+            done += end - start
+            if progress:
+                progress(done, total)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(parse_range, path, start, end, columns): i
+                       for i, (start, end) in enumerate(ranges)}
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                start, end = ranges[i]
+                done += end - start
+                if progress:
+                    progress(done, total)
+
+    # Merge in file order so "first Volunteer_ID wins" matches a serial read
+    frames = []
+    for rows, clean, quarantined, nulled in results:
+        report["rows_read"] += rows
+        frames.append(clean)
+        record_quarantine(report, quarantined, quarantine_path)
+        record_nulled(report, nulled)
+
+    df, duplicates = finalize(frames)
+    record_quarantine(report, duplicates, quarantine_path)
+    report.pop("_quarantine_written", None)
+    report["rows_clean"] = len(df)
+    return df, report
+
+
+# ------------------------------
+# Benchmark
+# ------------------------------
+def make_large_csv(source, target, rows):
+    """Replicate ``source`` rows (with fresh Volunteer_IDs) up to ``rows``."""
+    base = pd.read_csv(source, dtype=str, keep_default_na=False)
+    with open(target, "w") as f:
+        written = 0
+        while written < rows:
+            block = base.head(rows - written).copy()
+            block["Volunteer_ID"] = [str(101 + written + i) for i in range(len(block))]
+            block.to_csv(f, header=(written == 0), index=False)
+            written += len(block)
+
+
+def benchmark(rows, source="NGO_Volunteers_Maharashtra_1000.csv", chunk_bytes=8 * 1024 * 1024):
+    from cleaning import clean_volunteer_csv
+
+    target = f"bench_volunteers_{rows}.csv"
+    if not os.path.exists(target):
+        make_large_csv(source, target, rows)
+    size_mb = os.path.getsize(target) / 1e6
+    print(f"{rows} rows, {size_mb:.0f} MB, {os.cpu_count()} cores")
+
+    start = time.perf_counter()
+    clean_volunteer_csv(target)
+    baseline = time.perf_counter() - start
+    print(f"{'serial clean_volunteer_csv':28s} {baseline:7.2f}s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        ingest_csv(target, workers=workers, chunk_bytes=chunk_bytes)
+        elapsed = time.perf_counter() - start
+        print(f"{f'ingest_csv workers={workers}':28s} {elapsed:7.2f}s  speedup x{baseline / elapsed:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel volunteer CSV ingestion")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    benchmark(args.rows)
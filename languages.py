@@ -0,0 +1,64 @@
+# ------------------------------
+# languages.py - language bitmask index
+# ------------------------------
+# Languages_Known is free text ("hindi, marathi, english"). It is parsed once
+# into a vocabulary and one bitmask per volunteer (64 languages per uint64
+# word), so "speaks Marathi AND Hindi" or "speaks any of these" is a single
+# vectorized bitwise test over all volunteers.
+
+import numpy as np
+import pandas as pd
+
+
+def parse_languages(value):
+    """Split a Languages_Known value (or a query) into normalized names."""
+    if isinstance(value, (list, tuple, set)):
+        parts = value
+    elif isinstance(value, str):
+        parts = value.replace(";", ",").replace("/", ",").split(",")
+    else:
+        return []
+    return [p.strip().lower() for p in parts if isinstance(p, str) and p.strip()]
+
+
+class LanguageIndex:
+    """Per-volunteer language bitmasks over a shared vocabulary."""
+
+    def __init__(self, languages_known):
+        # Parse each distinct string once; rosters repeat a handful of combinations
+        codes, uniques = pd.factorize(pd.Series(languages_known), use_na_sentinel=True)
+        parsed = [parse_languages(u) for u in uniques]
+        self.vocabulary = sorted({lang for langs in parsed for lang in langs})
+        self.bit = {lang: i for i, lang in enumerate(self.vocabulary)}
+        self.words = max(1, -(-len(self.vocabulary) // 64))
+
+        unique_masks = np.zeros((len(uniques) + 1, self.words), dtype=np.uint64)
+        for u, langs in enumerate(parsed):
+            unique_masks[u] = self._encode(langs)
+        # Code -1 (missing) maps to the trailing all-zero row
+        self.masks = unique_masks[codes]
+
+    def _encode(self, languages):
+        mask = np.zeros(self.words, dtype=np.uint64)
+        for lang in languages:
+            i = self.bit.get(lang)
+            if i is not None:
+                mask[i // 64] |= np.uint64(1) << np.uint64(i % 64)
+        return mask
+
+    def match(self, languages, mode="all"):
+        """Boolean array: volunteers speaking all (or any) of ``languages``."""
+        wanted = parse_languages(languages)
+        if not wanted:
+            return np.ones(len(self.masks), dtype=bool)
+        if mode == "all" and any(lang not in self.bit for lang in wanted):
+            return np.zeros(len(self.masks), dtype=bool)
+        query = self._encode(wanted)
+        hits = self.masks & query
+        if mode == "any":
+            return (hits != 0).any(axis=1)
+        return (hits == query).all(axis=1)
+
+    def languages_of(self, row):
+        mask = self.masks[row]
+        return [lang for lang, i in self.bit.items() if int(mask[i // 64]) >> (i % 64) & 1]
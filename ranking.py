@@ -0,0 +1,146 @@
+# ------------------------------
+# ranking.py - precomputed volunteer quality scores
+# ------------------------------
+# A composite score is computed for every volunteer in one vectorized pass.
+# Volunteers are then kept in per-(skill, district) lists sorted by score,
+# plus per-skill, per-district and global lists, so "best K Teaching
+# volunteers in Pune" is a slice of a ready-made list. When a volunteer's
+# stats change only their entries are moved.
+
+import heapq
+from bisect import bisect_left, insort
+
+import numpy as np
+import pandas as pd
+
+from geo import canonical_district
+
+# Relative weight of each signal in the composite score (sums to 1)
+SCORE_WEIGHTS = {
+    "Experience_Years": 0.25,
+    "Satisfaction_Rating": 0.25,
+    "Showed_Up": 0.20,
+    "Volunteer_Hours": 0.15,
+    "Training_Completed": 0.15,
+}
+
+SCORE_COLUMNS = list(SCORE_WEIGHTS)
+
+# Values at or above these caps earn the full share of a signal
+EXPERIENCE_CAP = 10.0
+RATING_MIN, RATING_MAX = 1.0, 5.0
+
+
+def district_key(name):
+    if not isinstance(name, str) or not name.strip():
+        return None
+    return canonical_district(name) or " ".join(name.split()).title()
+
+
+def skill_key(name):
+    if not isinstance(name, str) or not name.strip():
+        return None
+    return name.strip()
+
+
+def composite_scores(experience, rating, showed_up, hours, trained, hours_cap):
+    """Vectorized score in [0, 1]; every argument is an array (or scalar)."""
+    w = SCORE_WEIGHTS
+    return (
+        w["Experience_Years"] * np.clip(experience / EXPERIENCE_CAP, 0, 1)
+        + w["Satisfaction_Rating"] * np.clip((rating - RATING_MIN) / (RATING_MAX - RATING_MIN), 0, 1)
+        + w["Showed_Up"] * np.clip(showed_up, 0, 1)
+        + w["Volunteer_Hours"] * np.clip(hours / hours_cap, 0, 1)
+        + w["Training_Completed"] * trained
+    )
+
+
+def _trained(values):
+    return np.asarray([str(v).strip().lower() in ("yes", "true", "1") for v in values], dtype=float)
+
+
+class VolunteerRanking:
+    """Score-sorted volunteer lists per (skill, district) bucket.
+
+    Each bucket holds ``(-score, row)`` tuples in ascending order, i.e. best
+    volunteer first, so the top K of a bucket is its first K entries.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        numeric = df[SCORE_COLUMNS[:-1]].apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy()
+        experience, rating, showed_up, hours = numeric.T
+        # Fixed at load time so later updates never rescale everyone else
+        self.hours_cap = max(float(np.percentile(hours, 99)) if len(hours) else 1.0, 1.0)
+        self.scores = composite_scores(experience, rating, showed_up, hours,
+                                       _trained(df["Training_Completed"]), self.hours_cap)
+
+        self.skills = [skill_key(s) for s in df["Primary_Skill"]]
+        self.districts = [district_key(d) for d in df["District"]]
+        self.skill_names = sorted({s for s in self.skills if s})
+        self.row_of = {vid: row for row, vid in enumerate(df["Volunteer_ID"])}
+
+        self.buckets = {}
+        order = np.lexsort((np.arange(len(df)), -self.scores))
+        for row in order:
+            entry = (-self.scores[row], int(row))
+            for key in self._keys(row):
+                self.buckets.setdefault(key, []).append(entry)
+
+    def _keys(self, row):
+        skill, district = self.skills[row], self.districts[row]
+        return ((skill, district), (skill, None), (None, district), (None, None))
+
+    def matching_skills(self, skill):
+        if not skill:
+            return [None]
+        skill = skill.strip().lower()
+        return [s for s in self.skill_names if skill in s.lower()]
+
+    def top(self, k, skill=None, district=None, mask=None):
+        """Row positions of the K best volunteers matching a skill (substring)
+        and district; several matching skills are merged lazily with a heap.
+
+        ``mask`` (boolean array over rows) further restricts the result; the
+        buckets are then walked until K rows pass it.
+        """
+        district = district_key(district)
+        lists = [self.buckets.get((s, district), []) for s in self.matching_skills(skill)]
+        if mask is None:
+            if len(lists) == 1:
+                return [row for _, row in lists[0][:k]]
+            return [row for _, row in heapq.merge(*(lst[:k] for lst in lists))][:k]
+        picked = []
+        for _, row in heapq.merge(*lists):
+            if mask[row]:
+                picked.append(row)
+                if len(picked) == k:
+                    break
+        return picked
+
+    def update(self, volunteer_id, stats):
+        """Apply new stat values for one volunteer and re-rank them."""
+        row = self.row_of[volunteer_id]
+        for column, value in stats.items():
+            kind = self.df[column].dtype.kind
+            if kind in "iu":
+                value = int(round(float(value)))
+            elif kind == "f":
+                value = float(value)
+            elif isinstance(self.df[column].dtype, pd.CategoricalDtype) and value not in self.df[column].cat.categories:
+                self.df[column] = self.df[column].cat.add_categories([value])
+            self.df.iat[row, self.df.columns.get_loc(column)] = value
+
+        old = (-self.scores[row], row)
+        values = self.df.iloc[row]
+        new_score = float(composite_scores(
+            float(values["Experience_Years"]), float(values["Satisfaction_Rating"]),
+            float(values["Showed_Up"]), float(values["Volunteer_Hours"]),
+            _trained([values["Training_Completed"]])[0], self.hours_cap,
+        ))
+        self.scores[row] = new_score
+        for key in self._keys(row):
+            bucket = self.buckets[key]
+            del bucket[bisect_left(bucket, old)]
+            insort(bucket, (-new_score, row))
+        return new_score
@@ -0,0 +1,129 @@
+# ------------------------------
+# sampling.py - seeded, stratified team sampling
+# ------------------------------
+# Team formation draws members at random, but reproducibly: the generator is
+# seeded from the request itself (or an explicit seed), so the same request
+# always yields the same team and responses can be cached and audited.
+#
+# Candidates are split into strata (district x skill). Each stratum gets a
+# share of the team proportional to its size, and is filled by score-weighted
+# sampling without replacement (Efraimidis-Spirakis: key = u ** (1 / w), keep
+# the largest keys). All strata are handled in one pass with a single sort.
+#
+#     python sampling.py bench --volunteers 1000000 --team 1000
+
+import argparse
+import hashlib
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+# Added to every weight so volunteers with a zero score can still be drawn
+WEIGHT_FLOOR = 0.05
+
+
+def request_seed(params):
+    """64-bit seed derived from the request parameters (any "seed" key excluded)."""
+    spec = json.dumps({k: v for k, v in params.items() if k != "seed"}, sort_keys=True, default=str)
+    return int.from_bytes(hashlib.sha256(spec.encode("utf-8")).digest()[:8], "little")
+
+
+def strata_codes(*columns):
+    """Integer stratum per row for the combination of label ``columns``."""
+    codes = np.zeros(len(columns[0]), dtype=np.int64)
+    for column in columns:
+        labels, uniques = pd.factorize(column)
+        labels = np.where(labels < 0, len(uniques), labels)  # missing values form their own stratum
+        codes = codes * (len(uniques) + 1) + labels
+    return codes
+
+
+def allocate(sizes, k):
+    """Split ``k`` picks across strata in proportion to ``sizes`` (largest remainder)."""
+    exact = sizes * (k / sizes.sum())
+    quota = np.floor(exact).astype(np.int64)
+    short = k - int(quota.sum())
+    if short:
+        quota[np.argsort(quota - exact, kind="stable")[:short]] += 1
+    return quota
+
+
+def stratified_sample(strata, k, rng, weights=None):
+    """Positions of ``k`` sampled rows, highest sampling key first.
+
+    ``strata`` holds one integer code per row, ``weights`` (optional, > 0)
+    make a row proportionally more likely to be drawn within its stratum.
+    """
+    n = len(strata)
+    keys = rng.random(n)
+    if weights is not None:
+        keys **= 1.0 / np.asarray(weights, dtype=float)
+    if k >= n:
+        return np.argsort(-keys, kind="stable")
+
+    if strata.min() >= 0 and strata.max() < 4 * n:
+        inverse, sizes = strata, np.bincount(strata)  # small codes: no sort needed
+    else:
+        _, inverse, sizes = np.unique(strata, return_inverse=True, return_counts=True)
+    quota = allocate(sizes, k)
+    # Stratum ascending, key descending in one float sort (keys are in [0, 1]
+    # and practically never tie, so the faster unstable sort is deterministic)
+    order = np.argsort(inverse + (1.0 - keys))
+    starts = np.cumsum(sizes) - sizes
+    rank = np.arange(n) - np.repeat(starts, sizes)
+    chosen = order[rank < np.repeat(quota, sizes)]
+    return chosen[np.argsort(-keys[chosen], kind="stable")]
+
+
+def sample_team(candidates, strata, scores, k, seed):
+    """``k`` of the ``candidates`` row positions, stratified and score-weighted,
+    drawn with a generator seeded by ``seed``."""
+    candidates = np.asarray(candidates)
+    rng = np.random.default_rng(seed)
+    picked = stratified_sample(strata[candidates], k, rng, weights=WEIGHT_FLOOR + scores[candidates])
+    return candidates[picked]
+
+
+# ------------------------------
+# Benchmark
+# ------------------------------
+def benchmark(volunteers, team, repeat=5, districts=36, skills=14):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "District": pd.Categorical.from_codes(rng.integers(0, districts, volunteers),
+                                              [f"District_{i}" for i in range(districts)]),
+        "Primary_Skill": pd.Categorical.from_codes(rng.integers(0, skills, volunteers),
+                                                   [f"Skill_{i}" for i in range(skills)]),
+    })
+    scores = rng.random(volunteers)
+
+    start = time.perf_counter()
+    strata = strata_codes(df["District"], df["Primary_Skill"])
+    print(f"{volunteers} volunteers, {districts} districts x {skills} skills")
+    print(f"{'strata codes (load time)':34s} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    for label, skill_filter in [("whole roster", None), ("one skill", ["Skill_0"])]:
+        timings = []
+        for i in range(repeat):
+            start = time.perf_counter()
+            if skill_filter is None:
+                candidates = np.arange(volunteers)
+            else:
+                candidates = np.flatnonzero(df["Primary_Skill"].isin(skill_filter).to_numpy())
+            rows = sample_team(candidates, strata, scores, team, seed=request_seed({"skill": skill_filter, "i": i}))
+            timings.append(time.perf_counter() - start)
+        again = sample_team(candidates, strata, scores, team, seed=request_seed({"skill": skill_filter, "i": i}))
+        print(f"{f'team of {team}, {label}':34s} {np.mean(timings) * 1000:8.1f} ms "
+              f"(from {len(candidates)}, {df['District'].iloc[rows].nunique()} districts, "
+              f"replay identical: {np.array_equal(rows, again)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seeded stratified team sampling")
+    parser.add_argument("command", choices=["bench"])
+    parser.add_argument("--volunteers", type=int, default=1_000_000)
+    parser.add_argument("--team", type=int, default=1000)
+    args = parser.parse_args()
+    benchmark(args.volunteers, args.team)
@@ -15,6 +15,16 @@ def test_form_team():
         print("No team data available")
 
 
+# ---------------- Seeded Team (replayable) ----------------
+def test_seeded_team():
+    payload = {"skill": "Teaching", "team_size": 5, "seed": 42}
+    first = requests.post(f"{BASE_URL}/api/form_team", json=payload).json()
+    again = requests.post(f"{BASE_URL}/api/form_team", json=payload).json()
+    print("\n=== Seeded Team (seed 42) ===")
+    print(tabulate(first, headers="keys", tablefmt="grid"))
+    print("Replay identical:", first == again)
+
+
 # ---------------- Skilled Volunteers ----------------
 def test_skilled_volunteers():
     response = requests.post(f"{BASE_URL}/api/skilled_volunteers", json={"skill": "Teaching", "district": "Satara"})
@@ -26,6 +36,48 @@ def test_skilled_volunteers():
         print("No skilled volunteers available")
 
 
+# ---------------- Nearby Volunteers ----------------
+def test_nearby_volunteers():
+    response = requests.post(f"{BASE_URL}/api/skilled_volunteers",
+                             json={"skill": "Teaching", "district": "Satara", "radius_km": 150})
+    data = response.json()
+    print("\n=== Nearby Volunteers (within 150 km of Satara) ===")
+    if data:
+        print(tabulate(data, headers="keys", tablefmt="grid"))
+    else:
+        print("No nearby volunteers available")
+
+
+# ---------------- Language-filtered Team ----------------
+def test_language_team():
+    response = requests.post(f"{BASE_URL}/api/form_team",
+                             json={"skill": "Teaching", "team_size": 5, "languages": ["marathi", "hindi"]})
+    data = response.json()
+    print("\n=== Form Team (speaks Marathi and Hindi) ===")
+    if data:
+        print(tabulate(data, headers="keys", tablefmt="grid"))
+    else:
+        print("No team data available")
+
+
+# ---------------- Schedule Events ----------------
+def test_schedule_events():
+    events = [
+        {"event_id": "tuesday-class", "date": "2026-10-20", "skill": "Teaching", "headcount": 4},
+        {"event_id": "saturday-camp", "date": "2026-10-24", "skill": "Medical Assistance", "headcount": 3},
+    ]
+    response = requests.post(f"{BASE_URL}/api/schedule_events",
+                             json={"events": events, "max_events_per_volunteer": 1})
+    data = response.json()
+    print("\n=== Event Rosters ===")
+    if data.get("rosters"):
+        for roster in data["rosters"]:
+            print(f"{roster['event_id']} on {roster['date']} (shortfall {roster['shortfall']})")
+            print(tabulate(roster["assigned"], headers="keys", tablefmt="grid"))
+    else:
+        print("No rosters available")
+
+
 # ---------------- Show-up Prediction ----------------
 def test_showup_prediction():
     response = requests.post(f"{BASE_URL}/api/showup_prediction", json={"volunteer_features": [25, 5, 1]})
@@ -48,6 +100,57 @@ def test_recommend_volunteers():
         print("No recommendations available")
 
 
+# ---------------- Update Volunteer Stats ----------------
+def test_update_volunteer_stats():
+    response = requests.post(f"{BASE_URL}/api/volunteer_stats/101",
+                             json={"Volunteer_Hours": 9, "Satisfaction_Rating": 5})
+    print("\n=== Update Volunteer Stats ===")
+    try:
+        data = response.json()
+        print(data)
+    except:
+        print("Could not update volunteer stats")
+
+
+# ---------------- Dashboard Summary ----------------
+def test_dashboard_summary():
+    response = requests.get(f"{BASE_URL}/api/dashboard_summary",
+                            params={"group_by": "Primary_Skill", "District": "Pune"})
+    data = response.json()
+    print("\n=== Dashboard Summary (Pune by skill) ===")
+    if data.get("rows"):
+        print(tabulate(data["rows"], headers="keys", tablefmt="grid"))
+    else:
+        print("No dashboard summary available")
+
+
+# ---------------- Charts ----------------
+def test_charts():
+    print("\n=== Server-rendered Charts ===")
+    table = []
+    for path, params in [("skill_distribution.png", {"District": "Pune"}),
+                         ("team_composition.svg", {"skill": "Teaching", "team_size": 10}),
+                         ("engagement.png", {"volunteer_id": 1})]:
+        response = requests.get(f"{BASE_URL}/api/charts/{path}", params=params)
+        table.append({"Chart": path, "Status": response.status_code, "Type": response.headers.get("Content-Type"),
+                      "Bytes": len(response.content), "Cache-Control": response.headers.get("Cache-Control")})
+    print(tabulate(table, headers="keys", tablefmt="grid"))
+
+
+# ---------------- Server Load ----------------
+def test_admin_load():
+    response = requests.get(f"{BASE_URL}/api/admin/load")
+    print("\n=== Server Load (admission control) ===")
+    if not response.ok:
+        # Admission control runs in app.py only; async_app.py has no /api/admin/load
+        print(f"Load stats not available (HTTP {response.status_code})")
+        return
+    data = response.json()
+    print(f"In flight: {data['in_flight']} | Queue depth: {data['queue_depth']} "
+          f"| Queue latency: {data['queue_latency_ms']} ms")
+    print(tabulate([data["counters"]], headers="keys", tablefmt="grid"))
+
+
 # ---------------- Skill Gap Recommendations ----------------
 def test_skill_gap():
     response = requests.get(f"{BASE_URL}/api/skill_gap")
@@ -86,6 +189,26 @@ def test_volunteer_engagement():
         print("No engagement data available")
 
 
+# ---------------- Activity Log ----------------
+def test_activity():
+    events = [{"volunteer_id": 101, "kind": "check_in", "value": 1},
+              {"volunteer_id": 101, "kind": "hours", "value": 4},
+              {"volunteer_id": 101, "kind": "rating", "value": 5}]
+    requests.post(f"{BASE_URL}/api/activity", json={"events": events})
+    response = requests.get(f"{BASE_URL}/api/activity/volunteer/101")
+    print("\n=== Activity Windows (volunteer 101) ===")
+    if not response.ok:
+        # The activity log is served by app.py only, not async_app.py
+        print(f"Activity windows not available (HTTP {response.status_code})")
+        return
+    data = response.json()
+    if data.get("windows"):
+        table = [{"Window": w, **v} for w, v in data["windows"].items()]
+        print(tabulate(table, headers="keys", tablefmt="grid"))
+    else:
+        print("No activity recorded")
+
+
 # ---------------- Training Suggestions ----------------
 def test_training_suggestions():
     response = requests.get(f"{BASE_URL}/api/training_suggestions/1")
@@ -100,10 +223,19 @@ def test_training_suggestions():
 # ---------------- Run all tests ----------------
 if __name__ == "__main__":
     test_form_team()
+    test_seeded_team()
     test_skilled_volunteers()
+    test_nearby_volunteers()
+    test_language_team()
+    test_schedule_events()
     test_showup_prediction()
     test_recommend_volunteers()
+    test_update_volunteer_stats()
+    test_dashboard_summary()
+    test_charts()
+    test_admin_load()
     test_skill_gap()
     test_feedback_recommendations()
     test_volunteer_engagement()
     test_training_suggestions()
+    test_activity()